@@ -75,6 +75,14 @@ class Settings(BaseSettings):
     job_poll_interval_ms: int = Field(
         default=1000, description="Job polling interval in milliseconds"
     )
+    job_notify_fallback_poll_s: int = Field(
+        default=10,
+        description="Polling interval in seconds while LISTEN/NOTIFY wakeups are active",
+    )
+    job_per_org_max_concurrent: int | None = Field(
+        default=None,
+        description="Max jobs one org may have running at once (None for no cap)",
+    )
     job_max_attempts: int = Field(default=3, description="Maximum job retry attempts")
     job_backoff_base_ms: int = Field(
         default=1000, description="Base backoff delay in milliseconds"
@@ -88,6 +96,22 @@ class Settings(BaseSettings):
     job_cleanup_after_days: int = Field(
         default=7, description="Days to keep completed jobs"
     )
+    job_completion_flush_ms: int = Field(
+        default=50, description="Max delay before buffered job completions are written"
+    )
+    job_completion_batch_size: int = Field(
+        default=64, description="Max job completions written per batched UPDATE"
+    )
+    job_cache_ttl_s: float = Field(
+        default=1.0, description="Seconds a job loaded by ID is served from cache"
+    )
+    job_stats_cache_ttl_s: float = Field(
+        default=2.0, description="Seconds job statistics are served from cache"
+    )
+    item_cache_ttl_s: float = Field(
+        default=2.0,
+        description="Seconds item get/list responses are served from cache (0 disables)",
+    )
 
     # Embeddings Migration
     embeddings_async: bool = Field(
@@ -132,6 +156,11 @@ class Settings(BaseSettings):
     db_pool_recycle: int = Field(
         default=3600, description="Database connection recycle time in seconds"
     )
+    db_prepare_threshold: int | None = Field(
+        default=2,
+        description="Executions of a query before psycopg prepares it server-side "
+        "(None disables prepared statements, e.g. behind pgbouncer)",
+    )
 
     # Development defaults
     dev_user_id: str = Field(
@@ -25,6 +25,7 @@ class Database:
             pool_timeout=settings.db_pool_timeout,
             pool_recycle=settings.db_pool_recycle,
             echo=settings.debug,
+            connect_args=self._connect_args(settings),
         )
         self.SessionLocal = async_sessionmaker(
             bind=self.engine,
@@ -32,6 +33,19 @@ class Database:
             expire_on_commit=False,
         )
 
+    @staticmethod
+    def _connect_args(settings: Settings) -> dict:
+        """
+        Driver options for the psycopg prepared statement cache.
+
+        The worker and API repeat a small set of statement shapes, so
+        preparing them after fewer executions saves planning on every
+        later one.
+        """
+        if "+psycopg" not in settings.database_url:
+            return {}
+        return {"prepare_threshold": settings.db_prepare_threshold}
+
     async def close(self):
         """Close database connections."""
         await self.engine.dispose()
@@ -0,0 +1,72 @@
+"""
+In-process caches for short-lived hot reads and repeated compilation.
+"""
+
+import functools
+import re
+import time
+from collections.abc import Hashable
+
+
+class TTLCache[V]:
+    """
+    Small per-process cache whose entries expire after a fixed TTL.
+
+    Meant for data that is polled far more often than it changes (job status,
+    dashboard stats). Entries are not shared across processes, so the TTL is
+    what bounds staleness; explicit invalidation only helps the local process.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, V]] = {}
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Cache a value for the configured TTL."""
+        if self.ttl_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        if len(self._entries) >= self.maxsize and key not in self._entries:
+            self._evict(now)
+        self._entries[key] = (now + self.ttl_seconds, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones if still at capacity."""
+        for key in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+            del self._entries[key]
+
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_user_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """
+    Compile a user-supplied regex (e.g. short answer PATTERN), caching the result.
+
+    Import, payload validation and grading all see the same patterns, so each
+    one is compiled once per process. Raises re.error for invalid patterns.
+    """
+    return re.compile(pattern, flags)
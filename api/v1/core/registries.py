@@ -187,6 +187,10 @@ class Vectorizer(Protocol):
         """Compute embedding vector for text."""
         ...
 
+    def vectorize_batch(self, texts: list[str]) -> list[list[float]]:
+        """Compute embedding vectors for several texts, in input order."""
+        ...
+
     def get_dimension(self) -> int:
         """Get the dimension of vectors produced."""
         ...
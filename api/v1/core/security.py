@@ -1,3 +1,4 @@
+import functools
 from dataclasses import dataclass
 from uuid import NAMESPACE_DNS, UUID, uuid5
 
@@ -6,8 +7,14 @@ from fastapi import Depends, Header, HTTPException, status
 from api.config.settings import AuthMode, settings
 
 
+@functools.lru_cache(maxsize=4096)
 def string_to_uuid(text: str) -> UUID:
-    """Convert a string to a deterministic UUID using namespace DNS."""
+    """
+    Convert a string to a deterministic UUID using namespace DNS.
+
+    Cached because the same few org/user ids are converted several times
+    per request (principal.org_uuid / user_uuid).
+    """
     return uuid5(NAMESPACE_DNS, text)
 
 
@@ -21,6 +21,7 @@ from api.v1.gen.schemas import (
     GenerationDiagnostics,
     RejectedItem,
 )
+from api.v1.items.cache import invalidate_org_items
 from api.v1.items.models import Item
 from api.v1.items.routes import ensure_dev_entities_exist
 from api.v1.items.utils import normalize_tags, validate_difficulty
@@ -186,6 +187,8 @@ async def generate_items(
             staged_ids.append(item.id)
 
         await session.commit()
+        if staged_ids:
+            invalidate_org_items(principal.org_uuid)
 
         # Build diagnostics
         processing_time = int((time.time() - start_time) * 1000)
@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
@@ -105,9 +105,10 @@ async def _check_worker_health(
 ) -> WorkerHealth:
     """Check job worker health and queue status."""
 
+    now = datetime.now(UTC)
+
     # Count active workers based on recent heartbeats
-    heartbeat_threshold = datetime.now(UTC).timestamp() - 300  # 5 minutes
-    heartbeat_cutoff = datetime.fromtimestamp(heartbeat_threshold, UTC)
+    heartbeat_cutoff = now - timedelta(minutes=5)
 
     active_workers_result = await session.execute(
         select(func.count(func.distinct(Job.locked_by))).where(
@@ -126,12 +127,11 @@ async def _check_worker_health(
 
     last_heartbeat_age_seconds = None
     if last_heartbeat:
-        age_seconds = (datetime.now(UTC) - last_heartbeat).total_seconds()
+        age_seconds = (now - last_heartbeat).total_seconds()
         last_heartbeat_age_seconds = int(age_seconds)
 
     # Count stuck jobs (running jobs with old heartbeats)
-    stuck_threshold = datetime.now(UTC).timestamp() - settings.job_visibility_timeout_s
-    stuck_cutoff = datetime.fromtimestamp(stuck_threshold, UTC)
+    stuck_cutoff = now - timedelta(seconds=settings.job_visibility_timeout_s)
 
     stuck_jobs_result = await session.execute(
         select(func.count(Job.id)).where(
@@ -2,7 +2,7 @@
 Job system models for Step 11 background processing.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
@@ -152,10 +152,8 @@ class Job(Base):
         if self.status != JobStatus.RUNNING.value or not self.heartbeat_at:
             return False
 
-        from datetime import datetime
-
-        timeout_threshold = datetime.now(UTC).timestamp() - visibility_timeout_s
-        return self.heartbeat_at.timestamp() < timeout_threshold
+        timeout_threshold = datetime.now(UTC) - timedelta(seconds=visibility_timeout_s)
+        return self.heartbeat_at < timeout_threshold
 
     def get_progress_percentage(self) -> float | None:
         """Get progress as percentage if progress data is available."""
@@ -134,14 +134,11 @@ async def get_job(
     """Get a specific job by ID."""
 
     job_service = JobService(settings)
-    job = await job_service.get_job_by_id(session, job_id, principal.org_uuid)
+    job_data = await job_service.get_job_response(session, job_id, principal.org_uuid)
 
-    if not job:
+    if not job_data:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job_data = JobResponse.model_validate(job)
-    job_data.progress_percentage = job.get_progress_percentage()
-
     return create_success_response(data=job_data.model_dump())
 
 
@@ -227,21 +224,22 @@ async def retry_jobs_batch(
     """Retry multiple jobs in batch."""
 
     job_service = JobService(settings)
-    success_ids = []
-    failed_ids = []
     errors = {}
 
-    for job_id in request.job_ids:
-        try:
-            success = await job_service.retry_job(session, job_id, principal.org_uuid)
-            if success:
-                success_ids.append(job_id)
-            else:
-                failed_ids.append(job_id)
-                errors[str(job_id)] = "Job not found or not eligible for retry"
-        except Exception as e:
-            failed_ids.append(job_id)
-            errors[str(job_id)] = str(e)
+    # One UPDATE for the whole batch; ids it did not touch are reported as failed
+    try:
+        retried_ids = set(
+            await job_service.retry_jobs(session, request.job_ids, principal.org_uuid)
+        )
+        failure_reason = "Job not found or not eligible for retry"
+    except Exception as e:
+        retried_ids = set()
+        failure_reason = str(e)
+
+    success_ids = [job_id for job_id in request.job_ids if job_id in retried_ids]
+    failed_ids = [job_id for job_id in request.job_ids if job_id not in retried_ids]
+    for job_id in failed_ids:
+        errors[str(job_id)] = failure_reason
 
     logger.info(
         "Batch job retry via API",
@@ -269,21 +267,22 @@ async def cancel_jobs_batch(
     """Cancel multiple jobs in batch."""
 
     job_service = JobService(settings)
-    success_ids = []
-    failed_ids = []
     errors = {}
 
-    for job_id in request.job_ids:
-        try:
-            success = await job_service.cancel_job(session, job_id, principal.org_uuid)
-            if success:
-                success_ids.append(job_id)
-            else:
-                failed_ids.append(job_id)
-                errors[str(job_id)] = "Job not found or not eligible for cancellation"
-        except Exception as e:
-            failed_ids.append(job_id)
-            errors[str(job_id)] = str(e)
+    # One UPDATE for the whole batch; ids it did not touch are reported as failed
+    try:
+        canceled_ids = set(
+            await job_service.cancel_jobs(session, request.job_ids, principal.org_uuid)
+        )
+        failure_reason = "Job not found or not eligible for cancellation"
+    except Exception as e:
+        canceled_ids = set()
+        failure_reason = str(e)
+
+    success_ids = [job_id for job_id in request.job_ids if job_id in canceled_ids]
+    failed_ids = [job_id for job_id in request.job_ids if job_id not in canceled_ids]
+    for job_id in failed_ids:
+        errors[str(job_id)] = failure_reason
 
     logger.info(
         "Batch job cancel via API",
@@ -2,24 +2,84 @@
 Job service for enqueueing and managing background jobs.
 """
 
+import asyncio
+import functools
 import hashlib
+import json
 import logging
 import uuid
-from datetime import UTC, datetime
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from api.config.settings import Settings
+from sqlalchemy import (
+    and_,
+    any_,
+    bindparam,
+    func,
+    literal_column,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.config.settings import Settings, settings
+from api.v1.core.cache import TTLCache
 from api.v1.core.security import Principal
 from api.v1.infra.jobs.models import Job, JobStatus
-from api.v1.infra.jobs.schemas import JobCreate, JobEnqueueResponse, JobStatsResponse
+from api.v1.infra.jobs.schemas import (
+    JobCreate,
+    JobEnqueueResponse,
+    JobResponse,
+    JobStatsResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+# Statuses covered by the ix_jobs_dedupe_key_active partial unique index
+ACTIVE_DEDUPE_STATUSES = (
+    JobStatus.QUEUED.value,
+    JobStatus.RUNNING.value,
+    JobStatus.SUCCEEDED.value,
+)
+
+# Maximum rows removed per DELETE statement in cleanup_old_jobs
+CLEANUP_BATCH_SIZE = 10_000
+
+# Literal copy of the index predicate: Postgres can only infer a partial unique
+# index for ON CONFLICT when the WHERE clause uses constants, not bind params
+DEDUPE_INDEX_PREDICATE = text(
+    "dedupe_key IS NOT NULL AND status IN ('queued', 'running', 'succeeded')"
+)
+
+
+# Short-lived per-process caches for polled reads (status polling, dashboards).
+# Jobs are cached as JobResponse snapshots, never as ORM instances: a cached
+# Job would be detached from its closed session yet shared across requests.
+job_cache: TTLCache[JobResponse] = TTLCache(settings.job_cache_ttl_s)
+job_stats_cache: TTLCache[JobStatsResponse] = TTLCache(settings.job_stats_cache_ttl_s)
+
+
+def invalidate_cached_jobs(job_ids: Iterable[UUID]) -> None:
+    """Drop cached jobs whose state just changed."""
+    for job_id in job_ids:
+        job_cache.invalidate(job_id)
+
+
+def job_ids_param(job_ids: Iterable[UUID]):
+    """
+    Bind job ids as one uuid[] parameter for ``Job.id == ANY(...)``.
+
+    Unlike an expanding IN list, the statement text is the same for any
+    number of ids, so Postgres can reuse one prepared plan.
+    """
+    return bindparam("job_ids", list(job_ids), type_=ARRAY(PG_UUID))
+
 
 class JobService:
     """Service for managing background jobs."""
@@ -54,13 +114,26 @@ class JobService:
         if not org_id:
             raise ValueError("org_id is required for job enqueueing")
 
-        # Check for existing job with dedupe key
-        deduplicated = False
-        if job_create.dedupe_key:
+        values = self._build_job_values(
+            job_create, org_id, user_id, requested_by_user_id, request_id
+        )
+        result = await session.execute(
+            self._insert_jobs_statement(values).returning(Job.id, Job.status)
+        )
+        inserted = result.one_or_none()
+
+        if inserted is None:
+            # ON CONFLICT DO NOTHING skipped the row: an active job already
+            # holds this dedupe key
             existing_job = await self._find_existing_job(
                 session, job_create.dedupe_key, org_id
             )
-            if existing_job:
+            if not existing_job:
+                raise ValueError(
+                    f"dedupe_key {job_create.dedupe_key!r} is held by another job"
+                )
+
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
                     "Job deduplicated",
                     extra={
@@ -70,61 +143,144 @@ class JobService:
                         "org_id": str(org_id),
                     },
                 )
-                return JobEnqueueResponse(
-                    job_id=existing_job.id,
-                    status=existing_job.status,
-                    deduplicated=True,
-                )
-
-        # Create new job
-        job = Job(
-            id=uuid.uuid4(),
-            type=job_create.type,
-            org_id=org_id,
-            user_id=user_id,
-            payload=job_create.payload,
-            priority=job_create.priority,
-            run_at=job_create.run_at or datetime.now(UTC),
-            dedupe_key=job_create.dedupe_key,
-            requested_by_user_id=requested_by_user_id,
-            request_id=request_id,
-        )
+            return JobEnqueueResponse(
+                job_id=existing_job.id,
+                status=existing_job.status,
+                deduplicated=True,
+            )
 
-        try:
-            session.add(job)
-            await session.commit()
-            await session.refresh(job)
+        job_id, status = inserted
+        await session.commit()
 
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "Job enqueued",
                 extra={
-                    "job_id": str(job.id),
-                    "type": job.type,
-                    "priority": job.priority,
+                    "job_id": str(job_id),
+                    "type": job_create.type,
+                    "priority": job_create.priority,
                     "org_id": str(org_id),
                     "dedupe_key": job_create.dedupe_key,
                 },
             )
 
-            return JobEnqueueResponse(
-                job_id=job.id, status=job.status, deduplicated=deduplicated
+        return JobEnqueueResponse(job_id=job_id, status=status)
+
+    async def enqueue_many(
+        self,
+        session: AsyncSession,
+        job_creates: list[JobCreate],
+        principal: Principal | None = None,
+        request_id: str | None = None,
+    ) -> list[JobEnqueueResponse]:
+        """
+        Enqueue several jobs with one multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Jobs whose dedupe key matches an active job (or an earlier job in the
+        same batch) are reported as deduplicated instead of being inserted.
+
+        Returns:
+            One enqueue response per entry in ``job_creates``, in order
+        """
+        org_id = principal.org_uuid if principal else None
+        user_id = principal.user_uuid if principal else None
+
+        if not org_id:
+            raise ValueError("org_id is required for job enqueueing")
+
+        if not job_creates:
+            return []
+
+        rows = [
+            self._build_job_values(job_create, org_id, user_id, user_id, request_id)
+            for job_create in job_creates
+        ]
+        result = await session.execute(
+            self._insert_jobs_statement(rows).returning(Job.id, Job.status)
+        )
+        statuses = dict(result.tuples().all())
+        inserted_count = len(statuses)
+
+        # Rows skipped by ON CONFLICT resolve to the job holding their key
+        skipped_keys = {row["dedupe_key"] for row in rows if row["id"] not in statuses}
+        existing: dict[str, UUID] = {}
+        if skipped_keys:
+            existing_result = await session.execute(
+                select(Job.dedupe_key, Job.id, Job.status).where(
+                    and_(
+                        Job.dedupe_key.in_(skipped_keys),
+                        Job.org_id == org_id,
+                        Job.status.in_(ACTIVE_DEDUPE_STATUSES),
+                    )
+                )
             )
+            for key, job_id, status in existing_result:
+                existing[key] = job_id
+                statuses[job_id] = status
 
-        except IntegrityError as e:
-            await session.rollback()
-            # Check if this was a dedupe key conflict
-            if job_create.dedupe_key and "ix_jobs_dedupe_key_active" in str(e):
-                # Race condition - another process enqueued the same job
-                existing_job = await self._find_existing_job(
-                    session, job_create.dedupe_key, org_id
+        await session.commit()
+
+        responses = []
+        for row in rows:
+            if row["id"] in statuses:
+                responses.append(
+                    JobEnqueueResponse(job_id=row["id"], status=statuses[row["id"]])
                 )
-                if existing_job:
-                    return JobEnqueueResponse(
-                        job_id=existing_job.id,
-                        status=existing_job.status,
-                        deduplicated=True,
-                    )
-            raise
+                continue
+            job_id = existing.get(row["dedupe_key"])
+            if job_id is None:
+                raise ValueError(
+                    f"dedupe_key {row['dedupe_key']!r} is held by another job"
+                )
+            responses.append(
+                JobEnqueueResponse(
+                    job_id=job_id, status=statuses[job_id], deduplicated=True
+                )
+            )
+
+        logger.info(
+            "Jobs enqueued",
+            extra={
+                "job_count": inserted_count,
+                "deduplicated_count": len(rows) - inserted_count,
+                "org_id": str(org_id),
+            },
+        )
+
+        return responses
+
+    def _insert_jobs_statement(self, values: dict[str, Any] | list[dict[str, Any]]):
+        """INSERT for new job rows that skips rows colliding on an active dedupe key."""
+        return (
+            pg_insert(Job)
+            .values(values)
+            .on_conflict_do_nothing(
+                index_elements=[Job.dedupe_key],
+                index_where=DEDUPE_INDEX_PREDICATE,
+            )
+        )
+
+    def _build_job_values(
+        self,
+        job_create: JobCreate,
+        org_id: UUID,
+        user_id: UUID | None,
+        requested_by_user_id: UUID | None,
+        request_id: str | None,
+    ) -> dict[str, Any]:
+        """Build the column values for inserting a new job row."""
+        return {
+            "id": uuid.uuid4(),
+            "type": job_create.type,
+            "org_id": org_id,
+            "user_id": user_id,
+            "payload": job_create.payload,
+            "priority": job_create.priority,
+            "run_at": job_create.run_at or datetime.now(UTC),
+            "dedupe_key": job_create.dedupe_key,
+            "requested_by_user_id": requested_by_user_id,
+            "request_id": request_id,
+        }
 
     async def _find_existing_job(
         self, session: AsyncSession, dedupe_key: str, org_id: UUID
@@ -136,13 +292,7 @@ class JobService:
                 and_(
                     Job.dedupe_key == dedupe_key,
                     Job.org_id == org_id,
-                    Job.status.in_(
-                        [
-                            JobStatus.QUEUED.value,
-                            JobStatus.RUNNING.value,
-                            JobStatus.SUCCEEDED.value,
-                        ]
-                    ),
+                    Job.status.in_(ACTIVE_DEDUPE_STATUSES),
                 )
             )
             .limit(1)
@@ -160,62 +310,103 @@ class JobService:
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_job_response(
+        self, session: AsyncSession, job_id: UUID, org_id: UUID | None = None
+    ) -> JobResponse | None:
+        """
+        Get a job's API representation by ID with optional org scoping.
+
+        Served from job_cache for job_cache_ttl_s after each load, since
+        clients poll job status far more often than it changes. The returned
+        snapshot is shared with other requests and must not be modified.
+        """
+        cached = job_cache.get(job_id)
+        if cached is not None and (not org_id or cached.org_id == org_id):
+            return cached
+
+        job = await self.get_job_by_id(session, job_id, org_id)
+        if job is None:
+            return None
+
+        job_response = JobResponse.model_validate(job)
+        job_response.progress_percentage = job.get_progress_percentage()
+        job_cache.set(job_id, job_response)
+        return job_response
+
     async def get_job_stats(
         self, session: AsyncSession, org_id: UUID | None = None
     ) -> JobStatsResponse:
-        """Get job statistics, optionally scoped to organization."""
-        base_filter = Job.org_id == org_id if org_id else True
+        """
+        Get job statistics, optionally scoped to organization.
 
-        # Total jobs
-        total_result = await session.execute(
-            select(func.count(Job.id)).where(base_filter)
-        )
-        total_jobs = total_result.scalar() or 0
+        The aggregates are independent of each other, so each one runs on its
+        own session bound to the caller's engine and they are awaited together.
+        Results are cached per org for job_stats_cache_ttl_s.
+        """
+        cached = job_stats_cache.get(org_id)
+        if cached is not None:
+            return cached
+
+        base_filter = Job.org_id == org_id if org_id else True
+        one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
 
-        # Jobs by status
-        status_result = await session.execute(
+        queries = (
+            # Total jobs
+            select(func.count(Job.id)).where(base_filter),
+            # Jobs by status
             select(Job.status, func.count(Job.id))
             .where(base_filter)
-            .group_by(Job.status)
+            .group_by(Job.status),
+            # Jobs by type
+            select(Job.type, func.count(Job.id)).where(base_filter).group_by(Job.type),
+            # Failed jobs in last hour
+            select(func.count(Job.id)).where(
+                and_(
+                    base_filter,
+                    Job.status == JobStatus.FAILED.value,
+                    Job.updated_at >= one_hour_ago,
+                )
+            ),
+        )
+
+        session_factory = async_sessionmaker(
+            bind=session.bind, class_=AsyncSession, expire_on_commit=False
         )
-        by_status = dict(status_result.all())
 
-        # Jobs by type
-        type_result = await session.execute(
-            select(Job.type, func.count(Job.id)).where(base_filter).group_by(Job.type)
+        async def fetch_rows(query) -> list:
+            async with session_factory() as stats_session:
+                result = await stats_session.execute(query)
+                return result.all()
+
+        total_rows, status_rows, type_rows, failed_rows = await asyncio.gather(
+            *(fetch_rows(query) for query in queries)
         )
-        by_type = dict(type_result.all())
+
+        total_jobs = total_rows[0][0] or 0
+        by_status = dict(status_rows)
+        by_type = dict(type_rows)
+        failed_last_hour = failed_rows[0][0] or 0
 
         # Queue depth (queued + running)
         queue_depth = by_status.get(JobStatus.QUEUED.value, 0) + by_status.get(
             JobStatus.RUNNING.value, 0
         )
 
-        # Failed jobs in last hour
-        one_hour_ago = datetime.now(UTC).timestamp() - 3600
-        failed_recent_result = await session.execute(
-            select(func.count(Job.id)).where(
-                and_(
-                    base_filter,
-                    Job.status == JobStatus.FAILED.value,
-                    Job.updated_at >= datetime.fromtimestamp(one_hour_ago, UTC),
-                )
-            )
-        )
-        failed_last_hour = failed_recent_result.scalar() or 0
-
-        return JobStatsResponse(
+        stats = JobStatsResponse(
             total_jobs=total_jobs,
             by_status=by_status,
             by_type=by_type,
             queue_depth=queue_depth,
             failed_last_hour=failed_last_hour,
         )
+        job_stats_cache.set(org_id, stats)
+        return stats
 
     async def retry_job(
         self, session: AsyncSession, job_id: UUID, org_id: UUID | None = None
     ) -> bool:
         """Retry a failed job by resetting its status to queued."""
+        now = datetime.now(UTC)
         query = (
             update(Job)
             .where(
@@ -230,8 +421,8 @@ class JobService:
                 locked_at=None,
                 locked_by=None,
                 heartbeat_at=None,
-                run_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
+                run_at=now,
+                updated_at=now,
             )
         )
 
@@ -240,6 +431,7 @@ class JobService:
 
         success = result.rowcount > 0
         if success:
+            invalidate_cached_jobs([job_id])
             logger.info(
                 "Job retried",
                 extra={
@@ -271,6 +463,7 @@ class JobService:
 
         success = result.rowcount > 0
         if success:
+            invalidate_cached_jobs([job_id])
             logger.info(
                 "Job canceled",
                 extra={
@@ -281,30 +474,140 @@ class JobService:
 
         return success
 
+    async def retry_jobs(
+        self, session: AsyncSession, job_ids: list[UUID], org_id: UUID | None = None
+    ) -> list[UUID]:
+        """
+        Retry many failed jobs with one UPDATE ... WHERE id = ANY(...).
+
+        Requeued jobs get run_at spread by Postgres random() over up to
+        job_backoff_base_ms, so a large batch does not hit workers at once.
+
+        Returns:
+            IDs of the jobs that were requeued
+        """
+        if not job_ids:
+            return []
+
+        spread_seconds = self.settings.job_backoff_base_ms / 1000
+        result = await session.execute(
+            update(Job)
+            .where(
+                and_(
+                    Job.id == any_(job_ids_param(job_ids)),
+                    Job.status == JobStatus.FAILED.value,
+                    Job.org_id == org_id if org_id else True,
+                )
+            )
+            .values(
+                status=JobStatus.QUEUED.value,
+                locked_at=None,
+                locked_by=None,
+                heartbeat_at=None,
+                run_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, func.random() * spread_seconds),
+                updated_at=func.now(),
+            )
+            .returning(Job.id)
+        )
+        retried_ids = list(result.scalars().all())
+        await session.commit()
+        invalidate_cached_jobs(retried_ids)
+
+        if retried_ids:
+            logger.info(
+                "Jobs retried",
+                extra={
+                    "job_count": len(retried_ids),
+                    "org_id": str(org_id) if org_id else None,
+                },
+            )
+
+        return retried_ids
+
+    async def cancel_jobs(
+        self, session: AsyncSession, job_ids: list[UUID], org_id: UUID | None = None
+    ) -> list[UUID]:
+        """
+        Cancel many queued or running jobs with one UPDATE ... WHERE id = ANY(...).
+
+        Returns:
+            IDs of the jobs that were canceled
+        """
+        if not job_ids:
+            return []
+
+        result = await session.execute(
+            update(Job)
+            .where(
+                and_(
+                    Job.id == any_(job_ids_param(job_ids)),
+                    Job.status.in_([JobStatus.QUEUED.value, JobStatus.RUNNING.value]),
+                    Job.org_id == org_id if org_id else True,
+                )
+            )
+            .values(status=JobStatus.CANCELED.value, updated_at=func.now())
+            .returning(Job.id)
+        )
+        canceled_ids = list(result.scalars().all())
+        await session.commit()
+        invalidate_cached_jobs(canceled_ids)
+
+        if canceled_ids:
+            logger.info(
+                "Jobs canceled",
+                extra={
+                    "job_count": len(canceled_ids),
+                    "org_id": str(org_id) if org_id else None,
+                },
+            )
+
+        return canceled_ids
+
     async def cleanup_old_jobs(self, session: AsyncSession) -> int:
-        """Clean up old completed jobs based on retention policy."""
+        """
+        Clean up old completed jobs based on retention policy.
+
+        Rows are removed CLEANUP_BATCH_SIZE at a time via
+        DELETE ... WHERE ctid IN (SELECT ctid ... LIMIT n).
+        """
         retention_days = self.settings.job_cleanup_after_days
-        cutoff_date = datetime.now(UTC).timestamp() - (retention_days * 24 * 3600)
-        cutoff_datetime = datetime.fromtimestamp(cutoff_date, UTC)
+        cutoff_datetime = datetime.now(UTC) - timedelta(days=retention_days)
 
-        # Delete old completed jobs (succeeded, failed, deadletter, canceled)
-        delete_query = Job.__table__.delete().where(
-            and_(
-                Job.status.in_(
-                    [
-                        JobStatus.SUCCEEDED.value,
-                        JobStatus.FAILED.value,
-                        JobStatus.DEADLETTER.value,
-                        JobStatus.CANCELED.value,
-                    ]
-                ),
-                Job.updated_at < cutoff_datetime,
+        # Old completed jobs (succeeded, failed, deadletter, canceled)
+        expired_ctids = (
+            select(literal_column("ctid"))
+            .select_from(Job)
+            .where(
+                and_(
+                    Job.status.in_(
+                        [
+                            JobStatus.SUCCEEDED.value,
+                            JobStatus.FAILED.value,
+                            JobStatus.DEADLETTER.value,
+                            JobStatus.CANCELED.value,
+                        ]
+                    ),
+                    Job.updated_at < cutoff_datetime,
+                )
             )
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        delete_query = Job.__table__.delete().where(
+            literal_column("ctid").in_(expired_ctids)
         )
 
-        result = await session.execute(delete_query)
-        deleted_count = result.rowcount
-        await session.commit()
+        # Delete in bounded batches, each in its own short transaction, so
+        # locks and WAL per statement stay small and autovacuum keeps up
+        deleted_count = 0
+        while True:
+            result = await session.execute(delete_query)
+            await session.commit()
+            deleted_count += result.rowcount
+
+            if result.rowcount < CLEANUP_BATCH_SIZE:
+                break
+            await asyncio.sleep(0.1)
 
         if deleted_count > 0:
             logger.info(
@@ -319,6 +622,41 @@ class JobService:
 
     def generate_dedupe_key(self, job_type: str, **params: Any) -> str:
         """Generate a deterministic deduplication key for a job."""
-        # Create a stable hash from job type and parameters
-        key_data = f"{job_type}:{sorted(params.items())}"
-        return hashlib.sha256(key_data.encode()).hexdigest()[:32]
+        return generate_dedupe_key(job_type, **params)
+
+
+def _freeze_param(value: Any) -> Any:
+    """Make a dedupe parameter hashable; containers become canonical JSON."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _dedupe_key_digest(job_type: str, params: tuple[tuple[str, str, Any], ...]) -> str:
+    """Hash the canonical job type and parameters into a dedupe key."""
+    # Create a stable hash from job type and parameters. The key is a
+    # uniqueness tag, not a security boundary, so a 128-bit BLAKE2b digest
+    # (32 hex chars, same width as before) replaces truncated SHA-256.
+    # The type name is hashed too, so a list and a string holding its JSON
+    # (both frozen to the same text) still get different keys
+    key_data = f"{job_type}:{list(params)}"
+    return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+
+
+def generate_dedupe_key(job_type: str, **params: Any) -> str:
+    """
+    Generate a deterministic deduplication key for a job.
+
+    Keys are memoized, so producers that enqueue the same job repeatedly
+    (retry storms, scheduled workflows) skip the hashing.
+    """
+    # Tag each value with its type name: 1, True and 1.0 are equal and hash
+    # alike, and containers are frozen to JSON text like plain strings
+    frozen_params = tuple(
+        sorted(
+            (name, type(value).__name__, _freeze_param(value))
+            for name, value in params.items()
+        )
+    )
+    return _dedupe_key_digest(job_type, frozen_params)
@@ -7,21 +7,61 @@ import logging
 import os
 import random
 import socket
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, select, update
+import psycopg
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Text,
+    and_,
+    any_,
+    column,
+    func,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.config.settings import Settings
-from api.infra.database import get_session
+from api.infra.database import get_database
 from api.v1.core.registries import job_registry
 from api.v1.core.security import Principal
 from api.v1.infra.jobs.models import Job, JobStatus
+from api.v1.infra.jobs.service import invalidate_cached_jobs, job_ids_param
 
 logger = logging.getLogger(__name__)
 
+# Channel the jobs_notify_ready trigger publishes to when a job becomes queued
+JOBS_READY_CHANNEL = "jobs_ready"
+
+
+@dataclass
+class ClaimedJob:
+    """The columns of a claimed job that processing needs, without ORM state."""
+
+    id: UUID
+    type: str
+    org_id: UUID
+    user_id: UUID | None
+    payload: dict[str, Any]
+    attempts: int
+
+
+@dataclass
+class JobOutcome:
+    """Final state of a processed job, buffered until the next completion flush."""
+
+    job_id: UUID
+    status: JobStatus
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
 
 class JobWorker:
     """
@@ -32,7 +72,9 @@ class JobWorker:
     - Heartbeats and visibility timeout for stuck job recovery
     - Exponential backoff with jitter for retries
     - Graceful cancellation and shutdown
+    - LISTEN/NOTIFY wakeups instead of fixed-interval polling
     - Per-org concurrency limits
+    - Batched completion writes (one UPDATE per flush instead of per job)
     """
 
     def __init__(self, settings: Settings):
@@ -40,6 +82,18 @@ class JobWorker:
         self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{id(self)}"
         self.running = False
         self.active_jobs: set[UUID] = set()
+        # Strong references to in-flight job tasks so they are not collected
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._completion_buffer: asyncio.Queue[JobOutcome] = asyncio.Queue()
+        # Set by stop() once every job task has finished; the completion
+        # flusher drains what is left in the buffer and then exits
+        self._flusher_stop = asyncio.Event()
+        # Sessions are opened directly from the factory; get_session() is a
+        # FastAPI dependency and cannot be driven outside a request
+        self._session_factory = get_database(settings).SessionLocal
+        # Set by LISTEN notifications and finished jobs to wake _worker_loop
+        self._wakeup = asyncio.Event()
+        self._listening = False
 
     async def start(self) -> None:
         """Start the job worker main loop."""
@@ -47,6 +101,7 @@ class JobWorker:
             raise RuntimeError("Worker is already running")
 
         self.running = True
+        self._flusher_stop.clear()
         logger.info(
             "Starting job worker",
             extra={
@@ -61,6 +116,8 @@ class JobWorker:
                 self._worker_loop(),
                 self._heartbeat_loop(),
                 self._stuck_job_recovery_loop(),
+                self._flush_completions_loop(),
+                self._listen_loop(),
                 return_exceptions=True,
             )
         except Exception:
@@ -73,50 +130,56 @@ class JobWorker:
         """Stop the worker gracefully."""
         logger.info("Stopping job worker", extra={"worker_id": self.worker_id})
         self.running = False
+        self._wakeup.set()
 
         # Wait for active jobs to complete (with timeout)
         timeout_seconds = 30
-        waited = 0
-        while self.active_jobs and waited < timeout_seconds:
-            await asyncio.sleep(1)
-            waited += 1
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=timeout_seconds)
 
-        if self.active_jobs:
+        if self._tasks:
             logger.warning(
                 "Worker stopped with active jobs",
                 extra={
                     "worker_id": self.worker_id,
-                    "active_jobs": len(self.active_jobs),
+                    "active_jobs": len(self._tasks),
                 },
             )
+            # Cancelled jobs record themselves as canceled before exiting
+            pending = list(self._tasks)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Every job has now buffered its outcome (including CANCELED ones), so
+        # the flusher can write the rest and exit
+        self._flusher_stop.set()
 
     async def _worker_loop(self) -> None:
         """Main worker loop that claims and processes jobs."""
         while self.running:
             try:
-                # Check if we can process more jobs
+                # Check if we can process more jobs; a finishing job wakes us
                 if len(self.active_jobs) >= self.settings.job_concurrency:
-                    await asyncio.sleep(self.settings.job_poll_interval_ms / 1000)
+                    await self._wait_for_work()
                     continue
 
                 # Claim and process jobs
-                async for session in get_session():
+                claimed_slots = self.settings.job_concurrency - len(self.active_jobs)
+                async with self._session_factory() as session:
                     jobs_to_process = await self._claim_jobs(session)
 
-                    # Process jobs concurrently
-                    if jobs_to_process:
-                        tasks = [
-                            asyncio.create_task(self._process_job(job))
-                            for job in jobs_to_process
-                        ]
-                        # Don't await - let them run in background
-                        for task in tasks:
-                            asyncio.ensure_future(task)
+                # Process jobs concurrently in the background
+                for job in jobs_to_process:
+                    task = asyncio.create_task(self._process_job(job))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._task_done)
 
-                    break  # Exit session context
+                # A full batch means more work is likely waiting; claim again
+                if jobs_to_process and len(jobs_to_process) == claimed_slots:
+                    continue
 
-                # Sleep before next poll
-                await asyncio.sleep(self.settings.job_poll_interval_ms / 1000)
+                await self._wait_for_work()
 
             except Exception:
                 logger.exception(
@@ -124,10 +187,72 @@ class JobWorker:
                 )
                 await asyncio.sleep(5)  # Back off on errors
 
-    async def _claim_jobs(self, session: AsyncSession) -> list[Job]:
+    async def _wait_for_work(self) -> None:
+        """
+        Sleep until a job is enqueued, a slot frees up, or the poll timeout.
+
+        While LISTEN is active the timeout only needs to catch jobs whose
+        run_at was in the future when they were inserted, so it is longer.
+        """
+        timeout = (
+            self.settings.job_notify_fallback_poll_s
+            if self._listening
+            else self.settings.job_poll_interval_ms / 1000
+        )
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _listen_loop(self) -> None:
+        """Hold a LISTEN connection and wake the worker loop on new jobs."""
+        # The listener needs a raw psycopg connection, not a pooled session
+        conninfo = self.settings.database_url.replace("+psycopg", "")
+
+        while self.running:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    conninfo, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {JOBS_READY_CHANNEL}")
+                    self._listening = True
+                    # Jobs may have been enqueued while we were not listening
+                    self._wakeup.set()
+
+                    while self.running:
+                        async for _ in conn.notifies(timeout=1.0):
+                            self._wakeup.set()
+
+            except Exception:
+                logger.exception(
+                    "Error in job notification listener",
+                    extra={"worker_id": self.worker_id},
+                )
+                await asyncio.sleep(5)  # Back off on errors, polling covers us
+            finally:
+                self._listening = False
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        """Drop a finished job task and surface any exception it escaped with."""
+        self._tasks.discard(task)
+        self._wakeup.set()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Job task crashed",
+                exc_info=task.exception(),
+                extra={"worker_id": self.worker_id},
+            )
+
+    async def _claim_jobs(self, session: AsyncSession) -> list[ClaimedJob]:
         """
         Claim available jobs using SELECT FOR UPDATE SKIP LOCKED.
 
+        Selection and the status flip run as one statement:
+        UPDATE ... WHERE id IN (claimable CTE) RETURNING, so row locks are held
+        only for that statement. Claimed rows come back as plain ClaimedJob
+        values rather than hydrated ORM instances.
+
         Returns list of claimed jobs ready for processing.
         """
         available_slots = max(0, self.settings.job_concurrency - len(self.active_jobs))
@@ -136,26 +261,20 @@ class JobWorker:
 
         now = datetime.now(UTC)
 
-        # Claim jobs with FOR UPDATE SKIP LOCKED
-        claim_query = (
-            select(Job)
-            .where(and_(Job.status == JobStatus.QUEUED.value, Job.run_at <= now))
+        # Pick claimable jobs with FOR UPDATE SKIP LOCKED
+        claimable = (
+            select(Job.id)
+            .where(self._claimable_filter(now))
             .order_by(Job.priority, Job.run_at)
             .limit(available_slots)
             .with_for_update(skip_locked=True)
+            .cte("claimable")
         )
 
-        result = await session.execute(claim_query)
-        jobs_to_claim = result.scalars().all()
-
-        if not jobs_to_claim:
-            return []
-
-        # Update claimed jobs to running status
-        job_ids = [job.id for job in jobs_to_claim]
-        await session.execute(
+        # Mark them running and return the claimed rows in the same round-trip
+        result = await session.execute(
             update(Job)
-            .where(Job.id.in_(job_ids))
+            .where(Job.id.in_(select(claimable.c.id)))
             .values(
                 status=JobStatus.RUNNING.value,
                 locked_at=now,
@@ -164,140 +283,294 @@ class JobWorker:
                 attempts=Job.attempts + 1,
                 updated_at=now,
             )
+            .returning(
+                Job.id, Job.type, Job.org_id, Job.user_id, Job.payload, Job.attempts
+            )
+            .execution_options(synchronize_session=False)
         )
+        jobs_to_claim = [ClaimedJob(*row) for row in result.tuples()]
 
         await session.commit()
+        invalidate_cached_jobs(job.id for job in jobs_to_claim)
+
+        if not jobs_to_claim:
+            return []
+
+        job_ids = [job.id for job in jobs_to_claim]
 
         # Track active jobs
         self.active_jobs.update(job_ids)
 
-        logger.info(
-            "Claimed jobs",
-            extra={
-                "worker_id": self.worker_id,
-                "job_count": len(jobs_to_claim),
-                "job_ids": [str(job.id) for job in jobs_to_claim],
-            },
-        )
+        # Only stringify the id list when someone is reading DEBUG output
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Claimed job ids",
+                extra={
+                    "worker_id": self.worker_id,
+                    "job_ids": [str(job_id) for job_id in job_ids],
+                },
+            )
+        logger.info("Claimed %d jobs", len(jobs_to_claim))
 
         return jobs_to_claim
 
-    async def _process_job(self, job: Job) -> None:
+    def _claimable_filter(self, now: datetime) -> ColumnElement[bool]:
+        """
+        WHERE clause selecting jobs that may be claimed right now.
+
+        With job_per_org_max_concurrent set, each org's ready jobs are ranked
+        by (priority, run_at) and only the first ``cap - running`` of them are
+        eligible, so a single busy org cannot take every worker slot. Workers
+        claiming concurrently do not see each other's uncommitted claims, so
+        the cap can be briefly exceeded by up to one batch per worker.
+        """
+        ready = and_(Job.status == JobStatus.QUEUED.value, Job.run_at <= now)
+        cap = self.settings.job_per_org_max_concurrent
+        if cap is None:
+            return ready
+
+        running = (
+            select(Job.org_id, func.count().label("running"))
+            .where(Job.status == JobStatus.RUNNING.value)
+            .group_by(Job.org_id)
+            .subquery("running")
+        )
+        # Window functions cannot share a SELECT with FOR UPDATE, so the
+        # ranking lives in a subquery and the outer claim query locks by id
+        ranked = (
+            select(
+                Job.id,
+                Job.org_id,
+                func.row_number()
+                .over(partition_by=Job.org_id, order_by=(Job.priority, Job.run_at))
+                .label("rn"),
+            )
+            .where(ready)
+            .subquery("ranked")
+        )
+        fair_ids = (
+            select(ranked.c.id)
+            .outerjoin(running, running.c.org_id == ranked.c.org_id)
+            .where(ranked.c.rn + func.coalesce(running.c.running, 0) <= cap)
+        )
+
+        return and_(ready, Job.id.in_(fair_ids))
+
+    async def _process_job(self, job: ClaimedJob) -> None:
         """Process a single job with error handling and result storage."""
-        job_logger = logger.bind(job_id=str(job.id), job_type=job.type)
+        job_extra = {"job_id": str(job.id), "job_type": job.type}
 
-        try:
-            job_logger.info("Processing job started")
+        # One session for the whole job: the handler and any retry bookkeeping
+        async with self._session_factory() as session:
+            try:
+                logger.info("Processing job started", extra=job_extra)
 
-            # Get job handler from registry
-            handler = job_registry.get(job.type)
+                # Get job handler from registry
+                handler = job_registry.get(job.type)
 
-            # Create principal context for org/user isolation
-            principal = Principal(
-                user_id=str(job.user_id) if job.user_id else "system",
-                org_id=str(job.org_id),
-                roles=["admin"],  # Jobs run with admin privileges
-            )
+                # Create principal context for org/user isolation
+                principal = Principal(
+                    user_id=str(job.user_id) if job.user_id else "system",
+                    org_id=str(job.org_id),
+                    roles=["admin"],  # Jobs run with admin privileges
+                )
 
-            # Process job
-            async for session in get_session():
+                # Process job
                 result = await handler.handle(session, principal, job.payload)
 
                 # Mark job as succeeded
                 await self._mark_job_completed(
-                    session, job.id, JobStatus.SUCCEEDED, result=result
+                    job.id, JobStatus.SUCCEEDED, result=result
                 )
-                break
 
-            job_logger.info("Processing job completed successfully")
+                logger.info("Processing job completed successfully", extra=job_extra)
 
-        except asyncio.CancelledError:
-            # Handle graceful cancellation
-            job_logger.info("Job processing cancelled")
-            async for session in get_session():
-                await self._mark_job_completed(session, job.id, JobStatus.CANCELED)
-                break
+            except asyncio.CancelledError:
+                # Handle graceful cancellation
+                logger.info("Job processing cancelled", extra=job_extra)
+                await self._mark_job_completed(job.id, JobStatus.CANCELED)
 
-        except Exception as e:
-            job_logger.exception("Job processing failed", extra={"error": str(e)})
-
-            # Determine retry or deadletter
-            should_retry = job.can_retry(self.settings.job_max_attempts)
-
-            if should_retry:
-                # Schedule retry with exponential backoff
-                next_run_at = self._calculate_retry_time(job.attempts)
-                async for session in get_session():
-                    await self._schedule_retry(session, job.id, next_run_at, str(e))
-                    break
-                job_logger.info(
-                    "Job scheduled for retry",
-                    extra={"next_run_at": next_run_at.isoformat()},
+            except Exception as e:
+                logger.exception(
+                    "Job processing failed", extra={**job_extra, "error": str(e)}
                 )
-            else:
-                # Move to deadletter
-                async for session in get_session():
+
+                # Discard whatever the handler left in the transaction
+                await session.rollback()
+
+                # Determine retry or deadletter
+                should_retry = job.attempts < self.settings.job_max_attempts
+
+                if should_retry:
+                    # Schedule retry with exponential backoff
+                    delay_seconds = self._calculate_retry_delay(job.attempts)
+                    await self._schedule_retry(session, job.id, delay_seconds, str(e))
+                    logger.info(
+                        "Job scheduled for retry",
+                        extra={**job_extra, "retry_delay_s": round(delay_seconds, 3)},
+                    )
+                else:
+                    # Move to deadletter
                     await self._mark_job_completed(
-                        session, job.id, JobStatus.DEADLETTER, error=str(e)
+                        job.id, JobStatus.DEADLETTER, error=str(e)
                     )
-                    break
-                job_logger.error("Job moved to deadletter queue")
+                    logger.error("Job moved to deadletter queue", extra=job_extra)
 
-        finally:
-            # Remove from active jobs
-            self.active_jobs.discard(job.id)
+            finally:
+                # Remove from active jobs
+                self.active_jobs.discard(job.id)
 
     async def _mark_job_completed(
         self,
-        session: AsyncSession,
         job_id: UUID,
         status: JobStatus,
         result: dict[str, Any] | None = None,
         error: str | None = None,
     ) -> None:
-        """Mark job as completed with the given status and result."""
-        update_values = {
-            "status": status.value,
-            "locked_at": None,
-            "locked_by": None,
-            "heartbeat_at": None,
-            "updated_at": datetime.now(UTC),
-        }
-
-        if result is not None:
-            update_values["result"] = result
-
-        if error is not None:
-            update_values["last_error"] = error
-            update_values["error_code"] = "PROCESSING_ERROR"
+        """Buffer the job's final status; the completion flusher persists it."""
+        await self._completion_buffer.put(
+            JobOutcome(job_id=job_id, status=status, result=result, error=error)
+        )
+
+    async def _flush_completions_loop(self) -> None:
+        """Persist buffered job completions in batches."""
+        # Runs until stop() has seen every job task finish, then drains the
+        # buffer, so completions from jobs still running at shutdown are kept
+        while not self._flusher_stop.is_set() or not self._completion_buffer.empty():
+            outcomes = await self._drain_completions()
+            if not outcomes:
+                continue
 
+            try:
+                async with self._session_factory() as session:
+                    await self._flush_completions(session, outcomes)
+            except Exception:
+                logger.exception(
+                    "Error flushing job completions, retrying one by one",
+                    extra={"worker_id": self.worker_id, "batch_size": len(outcomes)},
+                )
+                await self._flush_completions_individually(outcomes)
+
+    async def _flush_completions_individually(self, outcomes: list[JobOutcome]) -> None:
+        """
+        Write outcomes one per transaction after a failed batch flush.
+
+        A single bad row (say, a result that cannot be stored) then only loses
+        that job's completion; stuck-job recovery picks the job up again.
+        """
+        for outcome in outcomes:
+            try:
+                async with self._session_factory() as session:
+                    await self._flush_completions(session, [outcome])
+            except Exception:
+                logger.exception(
+                    "Error flushing job completion",
+                    extra={"worker_id": self.worker_id, "job_id": str(outcome.job_id)},
+                )
+
+    async def _drain_completions(self) -> list[JobOutcome]:
+        """
+        Collect buffered completions for one flush.
+
+        Waits up to one flush interval for the first outcome, then keeps
+        collecting until the interval elapses or the batch is full.
+        """
+        flush_interval = self.settings.job_completion_flush_ms / 1000
+        try:
+            first = await asyncio.wait_for(
+                self._completion_buffer.get(), timeout=flush_interval
+            )
+        except TimeoutError:
+            return []
+
+        outcomes = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + flush_interval
+        while len(outcomes) < self.settings.job_completion_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                outcomes.append(
+                    await asyncio.wait_for(
+                        self._completion_buffer.get(), timeout=remaining
+                    )
+                )
+            except TimeoutError:
+                break
+
+        return outcomes
+
+    async def _flush_completions(
+        self, session: AsyncSession, outcomes: list[JobOutcome]
+    ) -> None:
+        """Write a batch of completions with one UPDATE ... FROM (VALUES ...)."""
+        outcome_rows = values(
+            column("id", PG_UUID),
+            column("status", Text),
+            column("result", JSON(none_as_null=True)),
+            column("last_error", Text),
+            column("error_code", Text),
+            name="outcomes",
+        ).data(
+            [
+                (
+                    outcome.job_id,
+                    outcome.status.value,
+                    outcome.result,
+                    outcome.error,
+                    "PROCESSING_ERROR" if outcome.error is not None else None,
+                )
+                for outcome in outcomes
+            ]
+        )
+
+        # Result and error columns keep their previous value when not provided
         await session.execute(
-            update(Job).where(Job.id == job_id).values(**update_values)
+            update(Job)
+            .where(Job.id == outcome_rows.c.id)
+            .values(
+                status=outcome_rows.c.status,
+                result=func.coalesce(outcome_rows.c.result, Job.result),
+                last_error=func.coalesce(outcome_rows.c.last_error, Job.last_error),
+                error_code=func.coalesce(outcome_rows.c.error_code, Job.error_code),
+                locked_at=None,
+                locked_by=None,
+                heartbeat_at=None,
+                updated_at=datetime.now(UTC),
+            )
         )
         await session.commit()
+        invalidate_cached_jobs(outcome.job_id for outcome in outcomes)
 
     async def _schedule_retry(
-        self, session: AsyncSession, job_id: UUID, run_at: datetime, error: str
+        self, session: AsyncSession, job_id: UUID, delay_seconds: float, error: str
     ) -> None:
-        """Schedule job for retry."""
+        """
+        Schedule job for retry after ``delay_seconds``.
+
+        run_at is computed by Postgres from NOW(), so retry times follow the
+        database clock rather than whichever worker host handled the failure.
+        """
         await session.execute(
             update(Job)
             .where(Job.id == job_id)
             .values(
                 status=JobStatus.QUEUED.value,
-                run_at=run_at,
+                run_at=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, delay_seconds),
                 locked_at=None,
                 locked_by=None,
                 heartbeat_at=None,
                 last_error=error,
                 error_code="RETRY_SCHEDULED",
-                updated_at=datetime.now(UTC),
+                updated_at=func.now(),
             )
         )
         await session.commit()
+        invalidate_cached_jobs([job_id])
 
-    def _calculate_retry_time(self, attempt: int) -> datetime:
-        """Calculate next retry time with exponential backoff and jitter."""
+    def _calculate_retry_delay(self, attempt: int) -> float:
+        """Calculate retry delay in seconds with exponential backoff and jitter."""
         base_delay = self.settings.job_backoff_base_ms / 1000  # Convert to seconds
         max_delay = self.settings.job_max_backoff_s
 
@@ -306,94 +579,89 @@ class JobWorker:
 
         # Add jitter (±25% random variation)
         jitter = delay * 0.25 * (2 * random.random() - 1)
-        final_delay = max(1, delay + jitter)
-
-        return datetime.fromtimestamp(datetime.now(UTC).timestamp() + final_delay, UTC)
+        return max(1, delay + jitter)
 
     async def _heartbeat_loop(self) -> None:
         """Update heartbeats for active jobs."""
-        while self.running:
-            try:
-                if self.active_jobs:
-                    async for session in get_session():
+        # One long-lived session; its connection returns to the pool on commit
+        async with self._session_factory() as session:
+            while self.running:
+                try:
+                    if self.active_jobs:
                         await session.execute(
                             update(Job)
                             .where(
                                 and_(
-                                    Job.id.in_(self.active_jobs),
+                                    Job.id == any_(job_ids_param(self.active_jobs)),
                                     Job.locked_by == self.worker_id,
                                 )
                             )
                             .values(heartbeat_at=datetime.now(UTC))
                         )
                         await session.commit()
-                        break
 
-                # Heartbeat every 30 seconds
-                await asyncio.sleep(30)
+                    # Heartbeat every 30 seconds
+                    await asyncio.sleep(30)
 
-            except Exception:
-                logger.exception(
-                    "Error updating heartbeats", extra={"worker_id": self.worker_id}
-                )
-                await asyncio.sleep(60)  # Back off on errors
+                except Exception:
+                    logger.exception(
+                        "Error updating heartbeats", extra={"worker_id": self.worker_id}
+                    )
+                    await session.rollback()
+                    await asyncio.sleep(60)  # Back off on errors
 
     async def _stuck_job_recovery_loop(self) -> None:
         """Recover jobs that are stuck due to worker crashes."""
-        while self.running:
-            try:
-                timeout_seconds = self.settings.job_visibility_timeout_s
-                cutoff_time = datetime.now(UTC).timestamp() - timeout_seconds
-                cutoff_datetime = datetime.fromtimestamp(cutoff_time, UTC)
-
-                async for session in get_session():
-                    # Find stuck running jobs
-                    stuck_jobs = await session.execute(
-                        select(Job).where(
+        # One long-lived session; its connection returns to the pool on commit
+        async with self._session_factory() as session:
+            while self.running:
+                try:
+                    timeout_seconds = self.settings.job_visibility_timeout_s
+                    now = datetime.now(UTC)
+                    cutoff_datetime = now - timedelta(seconds=timeout_seconds)
+
+                    # Requeue stuck running jobs in one atomic UPDATE ... RETURNING
+                    result = await session.execute(
+                        update(Job)
+                        .where(
                             and_(
                                 Job.status == JobStatus.RUNNING.value,
                                 Job.heartbeat_at < cutoff_datetime,
                             )
                         )
-                    )
-
-                    stuck_job_list = stuck_jobs.scalars().all()
-
-                    if stuck_job_list:
-                        stuck_job_ids = [job.id for job in stuck_job_list]
-
-                        # Reset stuck jobs to queued for retry
-                        await session.execute(
-                            update(Job)
-                            .where(Job.id.in_(stuck_job_ids))
-                            .values(
-                                status=JobStatus.QUEUED.value,
-                                locked_at=None,
-                                locked_by=None,
-                                heartbeat_at=None,
-                                error_code="WORKER_TIMEOUT",
-                                last_error=f"Job timeout after {timeout_seconds}s",
-                                updated_at=datetime.now(UTC),
-                            )
+                        .values(
+                            status=JobStatus.QUEUED.value,
+                            locked_at=None,
+                            locked_by=None,
+                            heartbeat_at=None,
+                            error_code="WORKER_TIMEOUT",
+                            last_error=f"Job timeout after {timeout_seconds}s",
+                            updated_at=now,
                         )
-                        await session.commit()
+                        .returning(Job.id)
+                    )
+                    stuck_job_ids = result.scalars().all()
+                    await session.commit()
 
+                    if stuck_job_ids:
                         logger.warning(
                             "Recovered stuck jobs",
                             extra={
                                 "stuck_job_count": len(stuck_job_ids),
+                                "stuck_job_ids": [
+                                    str(job_id) for job_id in stuck_job_ids
+                                ],
                                 "timeout_seconds": timeout_seconds,
                             },
                         )
 
-                    break
+                    # Check for stuck jobs every 5 minutes
+                    await asyncio.sleep(300)
 
-                # Check for stuck jobs every 5 minutes
-                await asyncio.sleep(300)
-
-            except Exception:
-                logger.exception("Error in stuck job recovery")
-                await asyncio.sleep(300)
+                except Exception:
+                    logger.exception("Error in stuck job recovery")
+                    await session.rollback()
+                    await asyncio.sleep(300)
 
 
 # Worker instance management
@@ -0,0 +1,30 @@
+"""Short-lived per-process cache of item read responses (get and list)."""
+
+from collections.abc import Hashable
+from typing import Any
+from uuid import UUID
+
+from api.config.settings import settings
+from api.v1.core.cache import TTLCache
+
+# Keys start with (org_id, generation). Bumping an org's generation on write
+# makes its older entries unreachable at once in this process; other processes
+# serve them until item_cache_ttl_s lapses.
+item_response_cache: TTLCache[Any] = TTLCache(settings.item_cache_ttl_s)
+_org_generations: dict[UUID, int] = {}
+
+
+def item_cache_key(org_id: UUID, *parts: Hashable) -> tuple:
+    """Build a cache key scoped to the org's current write generation."""
+    return (org_id, _org_generations.get(org_id, 0), *parts)
+
+
+def invalidate_org_items(org_id: UUID) -> None:
+    """Hide cached item responses for an org after its items changed."""
+    _org_generations[org_id] = _org_generations.get(org_id, 0) + 1
+
+
+def clear_item_cache() -> None:
+    """Drop every cached item response."""
+    item_response_cache.clear()
+    _org_generations.clear()
@@ -5,14 +5,175 @@ Implements the ImporterRegistry protocol for parsing external content
 into item dictionaries that can be staged and later approved.
 """
 
+import bisect
 import csv
 import json
 import re
-from io import StringIO
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from io import BytesIO, StringIO, TextIOWrapper
 from typing import Any
 
+from api.v1.core.cache import compile_user_pattern
 from api.v1.core.registries import Importer
 
+try:
+    # orjson ships with the optional "performance" extra. Its JSONDecodeError
+    # subclasses json.JSONDecodeError, so error handling is the same either way.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_MD_BLOCK_RE = re.compile(r":::(\w+)(.*?):::", re.DOTALL)
+_MD_OPTION_RE = re.compile(r"^([A-Z])\)")
+_MD_BLANK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+
+
+@dataclass
+class _Block:
+    """Fields collected from one markdown item block."""
+
+    payload: dict[str, Any]
+    tags: list[str] = field(default_factory=list)
+    difficulty: str | None = None
+    # MCQ (text, is_correct) pairs, turned into option dicts once at the end
+    options: list[tuple[str, bool]] = field(default_factory=list)
+
+
+_FieldHandler = Callable[[_Block, str], None]
+
+
+def _error(issue: str, **location: int) -> dict[str, Any]:
+    """Error diagnostic for the given source ``line``, ``row`` or ``item``."""
+    return {**location, "issue": issue, "severity": "error"}
+
+
+def _parse_block(
+    content: str,
+    handlers: dict[str, _FieldHandler],
+    payload: dict[str, Any],
+    fallback: _FieldHandler | None = None,
+) -> _Block:
+    """
+    Parse ``KEY: value`` lines of a block by looking up each key in handlers.
+
+    Lines without a known key are passed whole to ``fallback`` if given.
+    """
+    block = _Block(payload)
+    lookup = handlers.get
+    for line in filter(None, map(str.strip, content.splitlines())):
+        key, sep, value = line.partition(":")
+        handler = lookup(key) if sep else None
+        if handler is not None:
+            handler(block, value.strip())
+        elif fallback is not None:
+            fallback(block, line)
+    return block
+
+
+def _set_tags(block: _Block, value: str) -> None:
+    block.tags = [tag.strip() for tag in value.split(",")]
+
+
+def _set_difficulty(block: _Block, value: str) -> None:
+    block.difficulty = value.lower()
+
+
+def _set_payload(key: str) -> _FieldHandler:
+    """Handler storing the value under ``key`` in the payload."""
+
+    def handler(block: _Block, value: str) -> None:
+        block.payload[key] = value
+
+    return handler
+
+
+def _set_examples(block: _Block, value: str) -> None:
+    block.payload["examples"] = [ex.strip() for ex in value.split(",")]
+
+
+def _set_hint(block: _Block, value: str) -> None:
+    block.payload["hints"] = [value]
+
+
+def _add_mcq_option(block: _Block, line: str) -> None:
+    """Parse an option line like "A) Option text *correct"."""
+    if not _MD_OPTION_RE.match(line):
+        return
+
+    # Drop the "A)" label and any ' *correct' marker with a single slice
+    is_correct = line.endswith(" *correct")
+    block.options.append((line[2 : -9 if is_correct else None].strip(), is_correct))
+
+
+def _set_cloze_text(block: _Block, value: str) -> None:
+    """Replace [[Answer|Alt Answer]] blanks with placeholders."""
+    blanks: list[dict[str, Any]] = []
+    # split() alternates literal text (even indexes) and blank contents (odd)
+    parts = _MD_BLANK_RE.split(value)
+    for i in range(1, len(parts), 2):
+        blank_id = len(blanks)
+        answers = [ans.strip() for ans in parts[i].split("|")]
+
+        blanks.append(
+            {
+                "id": str(blank_id),
+                "answers": [answers[0]],  # Primary answer
+                "alt_answers": answers[1:] if len(answers) > 1 else [],
+                "case_sensitive": False,  # Default to case insensitive
+            }
+        )
+        parts[i] = f"___BLANK_{blank_id}___"
+
+    block.payload["text"] = "".join(parts)
+    block.payload["blanks"] = blanks
+
+
+def _set_expected(block: _Block, value: str) -> None:
+    # Try to parse as number with unit
+    if " " in value:
+        number, unit = value.rsplit(" ", 1)
+        try:
+            float(number)
+            block.payload["expected"] = {"value": number, "unit": unit}
+        except ValueError:
+            block.payload["expected"] = {"value": value}
+    else:
+        block.payload["expected"] = {"value": value}
+
+
+def _add_pattern(block: _Block, value: str) -> None:
+    block.payload["acceptable_patterns"].append(value)
+
+
+_COMMON_HANDLERS: dict[str, _FieldHandler] = {
+    "TAGS": _set_tags,
+    "DIFFICULTY": _set_difficulty,
+}
+_FLASHCARD_HANDLERS: dict[str, _FieldHandler] = {
+    **_COMMON_HANDLERS,
+    "Q": _set_payload("front"),
+    "A": _set_payload("back"),
+    "HINT": _set_hint,
+    "AUDIO": _set_payload("pronunciation"),
+    "EXAMPLES": _set_examples,
+}
+_MCQ_HANDLERS: dict[str, _FieldHandler] = {
+    **_COMMON_HANDLERS,
+    "STEM": _set_payload("stem"),
+}
+_CLOZE_HANDLERS: dict[str, _FieldHandler] = {
+    **_COMMON_HANDLERS,
+    "TEXT": _set_cloze_text,
+    "CONTEXT": _set_payload("context_note"),
+}
+_SHORT_ANSWER_HANDLERS: dict[str, _FieldHandler] = {
+    **_COMMON_HANDLERS,
+    "PROMPT": _set_payload("prompt"),
+    "EXPECTED": _set_expected,
+    "PATTERN": _add_pattern,
+}
+
 
 class MarkdownImporter(Importer):
     """
@@ -53,44 +214,40 @@ class MarkdownImporter(Importer):
         items = []
         diagnostics = kwargs.get("diagnostics", [])
 
+        # Newline offsets let each block's line number be found by bisection
+        # instead of recounting the whole prefix for every block
+        newline_offsets = [m.start() for m in re.finditer("\n", data)]
+
         # Find all code blocks with item type annotations
-        pattern = r":::(\w+)(.*?):::"
-        matches = re.finditer(pattern, data, re.DOTALL)
+        matches = _MD_BLOCK_RE.finditer(data)
+
+        parsers = {
+            "flashcard": self._parse_flashcard,
+            "mcq": self._parse_mcq,
+            "cloze": self._parse_cloze,
+            "short": self._parse_short_answer,
+        }
 
         for match in matches:
             item_type = match.group(1).lower()
             content = match.group(2).strip()
-            line_start = data[: match.start()].count("\n") + 1
+            line_start = bisect.bisect_left(newline_offsets, match.start()) + 1
 
             try:
-                if item_type == "flashcard":
-                    item = self._parse_flashcard(content, line_start, diagnostics)
-                elif item_type == "mcq":
-                    item = self._parse_mcq(content, line_start, diagnostics)
-                elif item_type == "cloze":
-                    item = self._parse_cloze(content, line_start, diagnostics)
-                elif item_type == "short":
-                    item = self._parse_short_answer(content, line_start, diagnostics)
-                else:
+                parse_block = parsers.get(item_type)
+                if parse_block is None:
                     diagnostics.append(
-                        {
-                            "line": line_start,
-                            "issue": f"Unknown item type: {item_type}",
-                            "severity": "error",
-                        }
+                        _error(f"Unknown item type: {item_type}", line=line_start)
                     )
                     continue
 
+                item = parse_block(content, line_start, diagnostics)
                 if item:
                     items.append(item)
 
             except Exception as e:
                 diagnostics.append(
-                    {
-                        "line": line_start,
-                        "issue": f"Error parsing {item_type}: {str(e)}",
-                        "severity": "error",
-                    }
+                    _error(f"Error parsing {item_type}: {str(e)}", line=line_start)
                 )
 
         return items
@@ -99,46 +256,22 @@ class MarkdownImporter(Importer):
         self, content: str, line_start: int, diagnostics: list
     ) -> dict[str, Any] | None:
         """Parse flashcard content."""
-        lines = content.strip().split("\n")
-        payload = {}
-        tags = []
-        difficulty = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith("Q:"):
-                payload["front"] = line[2:].strip()
-            elif line.startswith("A:"):
-                payload["back"] = line[2:].strip()
-            elif line.startswith("HINT:"):
-                payload["hints"] = [line[5:].strip()]
-            elif line.startswith("AUDIO:"):
-                payload["pronunciation"] = line[6:].strip()
-            elif line.startswith("EXAMPLES:"):
-                payload["examples"] = [ex.strip() for ex in line[9:].split(",")]
-            elif line.startswith("TAGS:"):
-                tags = [tag.strip() for tag in line[5:].split(",")]
-            elif line.startswith("DIFFICULTY:"):
-                difficulty = line[11:].strip().lower()
+        block = _parse_block(content, _FLASHCARD_HANDLERS, {})
+        payload = block.payload
 
         if not payload.get("front") or not payload.get("back"):
             diagnostics.append(
-                {
-                    "line": line_start,
-                    "issue": "Flashcard missing required Q: and/or A: fields",
-                    "severity": "error",
-                }
+                _error(
+                    "Flashcard missing required Q: and/or A: fields", line=line_start
+                )
             )
             return None
 
         return {
             "type": "flashcard",
             "payload": payload,
-            "tags": tags,
-            "difficulty": difficulty,
+            "tags": block.tags,
+            "difficulty": block.difficulty,
             "metadata": {"source_format": "markdown", "source_line": line_start},
         }
 
@@ -146,70 +279,39 @@ class MarkdownImporter(Importer):
         self, content: str, line_start: int, diagnostics: list
     ) -> dict[str, Any] | None:
         """Parse multiple choice question content."""
-        lines = content.strip().split("\n")
-        payload = {"options": []}
-        tags = []
-        difficulty = None
-        option_counter = 0
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith("STEM:"):
-                payload["stem"] = line[5:].strip()
-            elif line.startswith("TAGS:"):
-                tags = [tag.strip() for tag in line[5:].split(",")]
-            elif line.startswith("DIFFICULTY:"):
-                difficulty = line[11:].strip().lower()
-            elif re.match(r"^[A-Z]\)", line):
-                # Parse option line like "A) Option text *correct"
-                is_correct = line.endswith(" *correct")
-                text = line[2:].strip()
-                if is_correct:
-                    text = text[:-9].strip()  # Remove ' *correct'
-
-                payload["options"].append(
-                    {"id": str(option_counter), "text": text, "is_correct": is_correct}
-                )
-                option_counter += 1
+        block = _parse_block(
+            content, _MCQ_HANDLERS, {"options": []}, fallback=_add_mcq_option
+        )
+        payload = block.payload
 
         if not payload.get("stem"):
             diagnostics.append(
-                {
-                    "line": line_start,
-                    "issue": "MCQ missing required STEM field",
-                    "severity": "error",
-                }
+                _error("MCQ missing required STEM field", line=line_start)
             )
             return None
 
-        if len(payload["options"]) < 2:
+        if len(block.options) < 2:
             diagnostics.append(
-                {
-                    "line": line_start,
-                    "issue": "MCQ must have at least 2 options",
-                    "severity": "error",
-                }
+                _error("MCQ must have at least 2 options", line=line_start)
             )
             return None
 
-        if not any(opt["is_correct"] for opt in payload["options"]):
+        if not any(is_correct for _, is_correct in block.options):
             diagnostics.append(
-                {
-                    "line": line_start,
-                    "issue": "MCQ must have at least one correct option",
-                    "severity": "error",
-                }
+                _error("MCQ must have at least one correct option", line=line_start)
             )
             return None
 
+        payload["options"] = [
+            {"id": str(i), "text": text, "is_correct": is_correct}
+            for i, (text, is_correct) in enumerate(block.options)
+        ]
+
         return {
             "type": "mcq",
             "payload": payload,
-            "tags": tags,
-            "difficulty": difficulty,
+            "tags": block.tags,
+            "difficulty": block.difficulty,
             "metadata": {"source_format": "markdown", "source_line": line_start},
         }
 
@@ -217,67 +319,23 @@ class MarkdownImporter(Importer):
         self, content: str, line_start: int, diagnostics: list
     ) -> dict[str, Any] | None:
         """Parse cloze deletion content."""
-        lines = content.strip().split("\n")
-        payload = {}
-        tags = []
-        difficulty = None
-        blanks = []  # Move outside the loop to avoid B023 violation
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith("TEXT:"):
-                text = line[5:].strip()
-                # Parse blanks in format [[Answer|Alt Answer]]
-                blanks.clear()  # Reset blanks for this TEXT block
-                blank_pattern = r"\[\[([^\]]+)\]\]"
-                blank_id = 0
-
-                def replace_blank(match):
-                    nonlocal blank_id
-                    answers_text = match.group(1)
-                    answers = [ans.strip() for ans in answers_text.split("|")]
-
-                    blanks.append(
-                        {
-                            "id": str(blank_id),
-                            "answers": [answers[0]],  # Primary answer
-                            "alt_answers": answers[1:] if len(answers) > 1 else [],
-                            "case_sensitive": False,  # Default to case insensitive
-                        }
-                    )
-                    placeholder = f"___BLANK_{blank_id}___"
-                    blank_id += 1
-                    return placeholder
-
-                processed_text = re.sub(blank_pattern, replace_blank, text)
-                payload["text"] = processed_text
-                payload["blanks"] = blanks
-
-            elif line.startswith("TAGS:"):
-                tags = [tag.strip() for tag in line[5:].split(",")]
-            elif line.startswith("DIFFICULTY:"):
-                difficulty = line[11:].strip().lower()
-            elif line.startswith("CONTEXT:"):
-                payload["context_note"] = line[8:].strip()
+        block = _parse_block(content, _CLOZE_HANDLERS, {})
+        payload = block.payload
 
         if not payload.get("text") or not payload.get("blanks"):
             diagnostics.append(
-                {
-                    "line": line_start,
-                    "issue": "Cloze missing required TEXT field with blanks [[answer]]",
-                    "severity": "error",
-                }
+                _error(
+                    "Cloze missing required TEXT field with blanks [[answer]]",
+                    line=line_start,
+                )
             )
             return None
 
         return {
             "type": "cloze",
             "payload": payload,
-            "tags": tags,
-            "difficulty": difficulty,
+            "tags": block.tags,
+            "difficulty": block.difficulty,
             "metadata": {"source_format": "markdown", "source_line": line_start},
         }
 
@@ -285,53 +343,35 @@ class MarkdownImporter(Importer):
         self, content: str, line_start: int, diagnostics: list
     ) -> dict[str, Any] | None:
         """Parse short answer content."""
-        lines = content.strip().split("\n")
-        payload = {"acceptable_patterns": [], "grading": {"method": "exact"}}
-        tags = []
-        difficulty = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith("PROMPT:"):
-                payload["prompt"] = line[7:].strip()
-            elif line.startswith("EXPECTED:"):
-                expected_text = line[9:].strip()
-                # Try to parse as number with unit
-                if " " in expected_text:
-                    value, unit = expected_text.rsplit(" ", 1)
-                    try:
-                        float(value)
-                        payload["expected"] = {"value": value, "unit": unit}
-                    except ValueError:
-                        payload["expected"] = {"value": expected_text}
-                else:
-                    payload["expected"] = {"value": expected_text}
-            elif line.startswith("PATTERN:"):
-                pattern = line[8:].strip()
-                payload["acceptable_patterns"].append(pattern)
-            elif line.startswith("TAGS:"):
-                tags = [tag.strip() for tag in line[5:].split(",")]
-            elif line.startswith("DIFFICULTY:"):
-                difficulty = line[11:].strip().lower()
+        block = _parse_block(
+            content,
+            _SHORT_ANSWER_HANDLERS,
+            {"acceptable_patterns": [], "grading": {"method": "exact"}},
+        )
+        payload = block.payload
 
         if not payload.get("prompt"):
             diagnostics.append(
-                {
-                    "line": line_start,
-                    "issue": "Short answer missing required PROMPT field",
-                    "severity": "error",
-                }
+                _error("Short answer missing required PROMPT field", line=line_start)
             )
             return None
 
+        # Compiling here reports bad patterns with their source line and warms
+        # the cache used by validation and grading
+        for pattern in payload["acceptable_patterns"]:
+            try:
+                compile_user_pattern(pattern)
+            except re.error as e:
+                diagnostics.append(
+                    _error(f"Invalid PATTERN '{pattern}': {e}", line=line_start)
+                )
+                return None
+
         return {
             "type": "short_answer",
             "payload": payload,
-            "tags": tags,
-            "difficulty": difficulty,
+            "tags": block.tags,
+            "difficulty": block.difficulty,
             "metadata": {"source_format": "markdown", "source_line": line_start},
         }
 
@@ -341,43 +381,58 @@ class CSVImporter(Importer):
 
     def parse(self, data: str | bytes, **kwargs: Any) -> list[dict[str, Any]]:
         """Parse CSV content into item dictionaries."""
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
-
         items = []
         diagnostics = kwargs.get("diagnostics", [])
 
         try:
-            reader = csv.DictReader(StringIO(data))
+            # Bytes are decoded as the reader consumes them rather than
+            # copied into one full-size str up front
+            if isinstance(data, bytes):
+                stream = TextIOWrapper(BytesIO(data), encoding="utf-8", newline="")
+            else:
+                stream = StringIO(data)
+            reader = csv.reader(stream)
+            header = next(reader, None)
+            if header is None:
+                return items
+
+            # Resolve column positions once. Absent columns point at an empty
+            # sentinel field appended after the header width, so every field
+            # is a plain index lookup.
+            width = len(header)
+            columns = {name: i for i, name in enumerate(header)}
+            type_i, payload_i, tags_i, difficulty_i = (
+                columns.get(name, width)
+                for name in ("type", "payload", "tags", "difficulty")
+            )
 
-            for row_num, row in enumerate(
-                reader, start=2
-            ):  # Start at 2 since header is row 1
+            # Start at 2 since header is row 1; blank lines are not counted
+            for row_num, row in enumerate(filter(None, reader), start=2):
                 try:
-                    item_type = row.get("type", "").lower()
+                    if len(row) != width:
+                        # Pad short rows and drop extra fields, like DictReader
+                        row = (row + [""] * width)[:width]
+                    row.append("")
+
+                    item_type = row[type_i].lower()
                     if not item_type:
-                        diagnostics.append(
-                            {
-                                "row": row_num,
-                                "issue": "Missing item type",
-                                "severity": "error",
-                            }
-                        )
+                        diagnostics.append(_error("Missing item type", row=row_num))
                         continue
 
                     # Parse payload from JSON string
-                    payload_str = row.get("payload", "{}")
-                    payload = json.loads(payload_str) if payload_str else {}
+                    payload_str = row[payload_i]
+                    payload = _json_loads(payload_str) if payload_str else {}
 
                     # Parse tags
-                    tags_str = row.get("tags", "")
-                    tags = [tag.strip() for tag in tags_str.split(",") if tag.strip()]
+                    tags = [
+                        tag.strip() for tag in row[tags_i].split(",") if tag.strip()
+                    ]
 
                     item = {
                         "type": item_type,
                         "payload": payload,
                         "tags": tags,
-                        "difficulty": row.get("difficulty") or None,
+                        "difficulty": row[difficulty_i] or None,
                         "metadata": {"source_format": "csv", "source_row": row_num},
                     }
 
@@ -385,25 +440,15 @@ class CSVImporter(Importer):
 
                 except json.JSONDecodeError as e:
                     diagnostics.append(
-                        {
-                            "row": row_num,
-                            "issue": f"Invalid JSON in payload: {str(e)}",
-                            "severity": "error",
-                        }
+                        _error(f"Invalid JSON in payload: {str(e)}", row=row_num)
                     )
                 except Exception as e:
                     diagnostics.append(
-                        {
-                            "row": row_num,
-                            "issue": f"Error parsing row: {str(e)}",
-                            "severity": "error",
-                        }
+                        _error(f"Error parsing row: {str(e)}", row=row_num)
                     )
 
         except Exception as e:
-            diagnostics.append(
-                {"issue": f"Error parsing CSV: {str(e)}", "severity": "error"}
-            )
+            diagnostics.append(_error(f"Error parsing CSV: {str(e)}"))
 
         return items
 
@@ -413,14 +458,12 @@ class JSONImporter(Importer):
 
     def parse(self, data: str | bytes, **kwargs: Any) -> list[dict[str, Any]]:
         """Parse JSON content into item dictionaries."""
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
-
         items = []
         diagnostics = kwargs.get("diagnostics", [])
 
         try:
-            parsed_data = json.loads(data)
+            # Both parsers accept UTF-8 bytes directly, so no decode step
+            parsed_data = _json_loads(data)
 
             # Handle both array format and object with 'items' key
             if isinstance(parsed_data, list):
@@ -429,43 +472,26 @@ class JSONImporter(Importer):
                 items_data = parsed_data["items"]
             else:
                 diagnostics.append(
-                    {
-                        "issue": 'JSON must be an array of items or object with "items" key',
-                        "severity": "error",
-                    }
+                    _error('JSON must be an array of items or object with "items" key')
                 )
                 return []
 
             for idx, item_data in enumerate(items_data):
                 try:
                     if not isinstance(item_data, dict):
-                        diagnostics.append(
-                            {
-                                "item": idx,
-                                "issue": "Item must be an object",
-                                "severity": "error",
-                            }
-                        )
+                        diagnostics.append(_error("Item must be an object", item=idx))
                         continue
 
                     # Validate required fields
                     if "type" not in item_data:
                         diagnostics.append(
-                            {
-                                "item": idx,
-                                "issue": 'Missing required "type" field',
-                                "severity": "error",
-                            }
+                            _error('Missing required "type" field', item=idx)
                         )
                         continue
 
                     if "payload" not in item_data:
                         diagnostics.append(
-                            {
-                                "item": idx,
-                                "issue": 'Missing required "payload" field',
-                                "severity": "error",
-                            }
+                            _error('Missing required "payload" field', item=idx)
                         )
                         continue
 
@@ -486,20 +512,12 @@ class JSONImporter(Importer):
 
                 except Exception as e:
                     diagnostics.append(
-                        {
-                            "item": idx,
-                            "issue": f"Error parsing item: {str(e)}",
-                            "severity": "error",
-                        }
+                        _error(f"Error parsing item: {str(e)}", item=idx)
                     )
 
         except json.JSONDecodeError as e:
-            diagnostics.append(
-                {"issue": f"Invalid JSON: {str(e)}", "severity": "error"}
-            )
+            diagnostics.append(_error(f"Invalid JSON: {str(e)}"))
         except Exception as e:
-            diagnostics.append(
-                {"issue": f"Error parsing JSON: {str(e)}", "severity": "error"}
-            )
+            diagnostics.append(_error(f"Error parsing JSON: {str(e)}"))
 
         return items
@@ -2,8 +2,8 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, CheckConstraint, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, TIMESTAMP, TSVECTOR
+from sqlalchemy import CheckConstraint, ForeignKey, Index, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TIMESTAMP, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -28,7 +28,7 @@ class Organization(Base, TimestampMixin):
     id: Mapped[UUID] = mapped_column(PG_UUID, primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     meta: Mapped[dict[str, Any]] = mapped_column(
-        JSON, default=dict, server_default="{}"
+        JSONB, default=dict, server_default="{}"
     )
 
     # Relationships
@@ -54,7 +54,7 @@ class User(Base, TimestampMixin):
     id: Mapped[UUID] = mapped_column(PG_UUID, primary_key=True, default=uuid4)
     email: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     meta: Mapped[dict[str, Any]] = mapped_column(
-        JSON, default=dict, server_default="{}"
+        JSONB, default=dict, server_default="{}"
     )
 
     # Foreign keys
@@ -73,7 +73,7 @@ class Source(Base, TimestampMixin):
     uri: Mapped[str] = mapped_column(Text, nullable=False)
     attribution: Mapped[str | None] = mapped_column(Text)
     meta: Mapped[dict[str, Any]] = mapped_column(
-        JSON, default=dict, server_default="{}"
+        JSONB, default=dict, server_default="{}"
     )
 
     # Foreign keys
@@ -95,7 +95,7 @@ class MediaAsset(Base, TimestampMixin):
         String(50), nullable=False
     )  # image, audio, video, etc.
     meta: Mapped[dict[str, Any]] = mapped_column(
-        JSON, default=dict, server_default="{}"
+        JSONB, default=dict, server_default="{}"
     )
 
     # Foreign keys
@@ -118,20 +118,20 @@ class Item(Base, TimestampMixin):
         ARRAY(Text), default=list, server_default="{}"
     )
     difficulty: Mapped[str | None] = mapped_column(String(20))  # intro, core, stretch
-    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
-    content_hash: Mapped[str | None] = mapped_column(
-        String(64)
-    )  # SHA-256 of canonical text
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    content_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32)
+    )  # Raw SHA-256 digest of canonical text
     schema_version: Mapped[int] = mapped_column(default=1, server_default="1")
     status: Mapped[str] = mapped_column(
         String(20), default="draft", server_default="draft"
     )
     version: Mapped[int] = mapped_column(default=1, server_default="1")
     media: Mapped[dict[str, Any]] = mapped_column(
-        JSON, default=dict, server_default="{}"
+        JSONB, default=dict, server_default="{}"
     )
     meta: Mapped[dict[str, Any]] = mapped_column(
-        JSON, default=dict, server_default="{}"
+        JSONB, default=dict, server_default="{}"
     )
     created_by: Mapped[str | None] = mapped_column(Text)
 
@@ -159,6 +159,7 @@ class Item(Base, TimestampMixin):
         Index("items_tags_gin", "tags", postgresql_using="gin"),
         Index("items_search_document_gin", "search_document", postgresql_using="gin"),
         Index("items_org_type_idx", "org_id", "type"),
-        Index("items_org_status_idx", "org_id", "status"),
+        Index("items_org_status_type_idx", "org_id", "status", "type"),
+        Index("items_org_created_idx", "org_id", "created_at", "id"),
         Index("items_content_hash_idx", "content_hash"),
     )
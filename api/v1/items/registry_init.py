@@ -13,17 +13,42 @@ from api.v1.items.validators import (
     ShortAnswerValidator,
 )
 
+# Validators and importers are stateless, so one instance each is shared
+_VALIDATORS = {
+    "flashcard": FlashcardValidator(),
+    "mcq": MCQValidator(),
+    "cloze": ClozeValidator(),
+    "short_answer": ShortAnswerValidator(),
+}
+_IMPORTERS = {
+    "markdown": MarkdownImporter(),
+    "csv": CSVImporter(),
+    "json": JSONImporter(),
+}
+
+# Registration runs once per process; repeated create_app() calls (tests,
+# reloads) would otherwise re-register into registries that may be frozen
+_validators_registered = False
+_importers_registered = False
+
 
 def register_item_validators():
     """Register all item type validators with the ItemTypeRegistry."""
-    item_type_registry.register("flashcard", FlashcardValidator())
-    item_type_registry.register("mcq", MCQValidator())
-    item_type_registry.register("cloze", ClozeValidator())
-    item_type_registry.register("short_answer", ShortAnswerValidator())
+    global _validators_registered
+    if _validators_registered:
+        return
+
+    for name, validator in _VALIDATORS.items():
+        item_type_registry.register(name, validator)
+    _validators_registered = True
 
 
 def register_importers():
     """Register all importers with the ImporterRegistry."""
-    importer_registry.register("markdown", MarkdownImporter())
-    importer_registry.register("csv", CSVImporter())
-    importer_registry.register("json", JSONImporter())
+    global _importers_registered
+    if _importers_registered:
+        return
+
+    for name, importer in _IMPORTERS.items():
+        importer_registry.register(name, importer)
+    _importers_registered = True
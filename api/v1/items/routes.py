@@ -1,16 +1,29 @@
+from collections.abc import Callable
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import and_, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from psycopg.types.json import Jsonb
+from pydantic import TypeAdapter
+from sqlalchemy import and_, exists, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.orm import raiseload
 
 from api.config.settings import Settings, SettingsDep
 from api.infra.database import SessionDep
 from api.v1.core.idempotency import get_idempotency_key, handle_idempotent_request
-from api.v1.core.registries import importer_registry, item_type_registry
+from api.v1.core.registries import (
+    ItemTypeValidator,
+    importer_registry,
+    item_type_registry,
+)
 from api.v1.core.security import Principal, PrincipalDep
+from api.v1.items.cache import (
+    invalidate_org_items,
+    item_cache_key,
+    item_response_cache,
+)
 from api.v1.items.models import Item, Organization, User
 from api.v1.items.schemas import (
     ApprovalRequest,
@@ -24,7 +37,12 @@ from api.v1.items.schemas import (
     ItemResponse,
     ItemUpdate,
 )
-from api.v1.items.utils import content_hash
+from api.v1.items.utils import (
+    canonical_text,
+    content_hash,
+    decode_cursor,
+    encode_cursor,
+)
 from api.v1.search.embedding_service import EmbeddingService
 from api.v1.search.hybrid_search import HybridSearchService
 
@@ -33,30 +51,88 @@ router = APIRouter()
 # Module-level dependency instances to avoid B008 violations
 _item_filters_dep = Depends()
 
+# ItemFilters fields passed to the search service when set
+_SEARCH_FILTER_FIELDS = (
+    "type",
+    "status",
+    "difficulty",
+    "source_id",
+    "created_by",
+    "tags",
+)
+
+# Parsed import items validated, deduplicated and flushed per round
+IMPORT_CHUNK_SIZE = 500
+
+# Item types accepted by import
+IMPORTABLE_ITEM_TYPES = frozenset({"flashcard", "mcq", "cloze", "short_answer"})
+
+# Batches at least this large are written with COPY instead of INSERT
+IMPORT_COPY_THRESHOLD = 100
+
+# Columns written by _copy_items; the rest take their server defaults
+_ITEM_COPY_COLUMNS = (
+    "id",
+    "org_id",
+    "type",
+    "payload",
+    "tags",
+    "difficulty",
+    "source_id",
+    "media",
+    "meta",
+    "content_hash",
+    "created_by",
+    "status",
+)
+_ITEM_COPY_SQL = f"COPY items ({', '.join(_ITEM_COPY_COLUMNS)}) FROM STDIN"
+
+# Validates a whole page of ORM items in one call rather than one per row
+_item_list_adapter = TypeAdapter(list[ItemResponse])
+
+# Bound render methods by item type. Validators register once per process at
+# app startup, so each type's lookup is resolved on first render and reused.
+_renderers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {}
+
+
+# Org/user ids already confirmed to exist. Lets later requests in this process
+# skip both lookups; anything that deletes those rows must call
+# forget_dev_entities().
+_known_orgs: set[UUID] = set()
+_known_users: set[UUID] = set()
+
+
+def forget_dev_entities() -> None:
+    """Clear the cache of org/user ids known to exist."""
+    _known_orgs.clear()
+    _known_users.clear()
+
 
 async def ensure_dev_entities_exist(session: AsyncSession, principal: Principal):
     """Ensure dev organization and user exist in the database."""
     org_uuid = principal.org_uuid
     user_uuid = principal.user_uuid
+    if org_uuid in _known_orgs and user_uuid in _known_users:
+        return
+
+    # Check both in one round trip
+    has_org, has_user = (
+        await session.execute(
+            select(
+                exists().where(Organization.id == org_uuid),
+                exists().where(User.id == user_uuid),
+            )
+        )
+    ).one()
 
-    # Check if org exists
-    org_result = await session.execute(
-        select(Organization).where(Organization.id == org_uuid)
-    )
-    org = org_result.scalar_one_or_none()
-
-    if not org:
+    if not has_org:
         # Create the organization
         org = Organization(
             id=org_uuid, name=principal.org_id, meta={"created_for": "development"}
         )
         session.add(org)
 
-    # Check if user exists
-    user_result = await session.execute(select(User).where(User.id == user_uuid))
-    user = user_result.scalar_one_or_none()
-
-    if not user:
+    if not has_user:
         # Create the user
         user = User(
             id=user_uuid,
@@ -66,7 +142,15 @@ async def ensure_dev_entities_exist(session: AsyncSession, principal: Principal)
         )
         session.add(user)
 
-    await session.commit()
+    if not (has_org and has_user):
+        try:
+            await session.commit()
+        except IntegrityError:
+            # Another worker created them concurrently; they exist either way
+            await session.rollback()
+
+    _known_orgs.add(org_uuid)
+    _known_users.add(user_uuid)
 
 
 async def get_item_by_id(
@@ -75,20 +159,13 @@ async def get_item_by_id(
     session: AsyncSession,
 ) -> Item:
     """Get an item by ID, ensuring it belongs to the user's org."""
-    result = await session.execute(
-        select(Item)
-        .where(
-            and_(
-                Item.id == item_id,
-                Item.org_id == principal.org_uuid,
-                Item.deleted_at.is_(None),
-            )
-        )
-        .options(selectinload(Item.source))
-    )
-
-    item = result.scalar_one_or_none()
-    if not item:
+    # Primary-key lookup: served from the identity map when this session has
+    # already loaded the item, otherwise one SELECT by id. Org and soft-delete
+    # checks happen here so other orgs' items are indistinguishable from missing.
+    # No caller reads relationships; raiseload turns an accidental lazy load
+    # (which async sessions cannot run implicitly anyway) into a clear error.
+    item = await session.get(Item, item_id, options=[raiseload("*")])
+    if item is None or item.org_id != principal.org_uuid or item.deleted_at is not None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Item not found"
         )
@@ -124,26 +201,31 @@ async def create_item(
     # Generate content hash
     hash_value = content_hash(item_data.type, validated_payload)
 
-    # Create the item
-    item = Item(
-        org_id=principal.org_uuid,
-        type=item_data.type,
-        payload=validated_payload,
-        tags=item_data.tags or [],
-        difficulty=item_data.difficulty,
-        source_id=item_data.source_id,
-        media=item_data.media or {},
-        meta=item_data.meta or {},
-        content_hash=hash_value,
-        created_by=principal.user_id,
-        status="draft",
+    # Insert and read back server defaults (id, created_at, version, ...) in
+    # one round trip; no refresh SELECT after the commit
+    result = await session.execute(
+        insert(Item)
+        .values(
+            org_id=principal.org_uuid,
+            type=item_data.type,
+            payload=validated_payload,
+            tags=item_data.tags or [],
+            difficulty=item_data.difficulty,
+            source_id=item_data.source_id,
+            media=item_data.media or {},
+            meta=item_data.meta or {},
+            content_hash=hash_value,
+            created_by=principal.user_id,
+            status="draft",
+        )
+        .returning(Item)
     )
+    response = ItemResponse.model_validate(result.scalar_one())
 
-    session.add(item)
     await session.commit()
-    await session.refresh(item)
+    invalidate_org_items(principal.org_uuid)
 
-    return ItemResponse.model_validate(item)
+    return response
 
 
 @router.get("/items", response_model=ItemList)
@@ -154,27 +236,46 @@ async def list_items(
     settings: Settings = SettingsDep,
 ):
     """List items with hybrid search, filtering, and pagination."""
+    return await _list_items(filters, principal, session, settings)
 
-    # Ensure dev entities exist
-    await ensure_dev_entities_exist(session, principal)
+
+async def _list_items(
+    filters: ItemFilters,
+    principal: Principal,
+    session: AsyncSession,
+    settings: Settings,
+) -> ItemList:
+    """Run an item list query; shared by the list and staged endpoints."""
+
+    cache_key = item_cache_key(principal.org_uuid, "list", filters.model_dump_json())
+    cached = item_response_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     # Use hybrid search service for enhanced search capabilities
     search_service = HybridSearchService(settings)
 
+    # Cursor pagination only applies to lists ordered by creation time
+    after = None
+    if filters.cursor:
+        if not search_service.supports_cursor(filters.q):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not supported for ranked search; use offset",
+            )
+        try:
+            after = decode_cursor(filters.cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+            ) from e
+
     # Convert filters to dict for search service
-    filter_dict = {}
-    if filters.type:
-        filter_dict["type"] = filters.type
-    if filters.status:
-        filter_dict["status"] = filters.status
-    if filters.difficulty:
-        filter_dict["difficulty"] = filters.difficulty
-    if filters.source_id:
-        filter_dict["source_id"] = filters.source_id
-    if filters.created_by:
-        filter_dict["created_by"] = filters.created_by
-    if filters.tags:
-        filter_dict["tags"] = filters.tags
+    filter_dict = {
+        field: value
+        for field in _SEARCH_FILTER_FIELDS
+        if (value := getattr(filters, field))
+    }
 
     # Perform search
     items, total = await search_service.search_items(
@@ -184,23 +285,58 @@ async def list_items(
         filters=filter_dict,
         limit=filters.limit,
         offset=filters.offset,
+        after=after,
     )
 
     # Convert to response format
-    item_responses = [ItemResponse.model_validate(item) for item in items]
+    item_responses = _item_list_adapter.validate_python(items, from_attributes=True)
+
+    # Past a cursor the offset is unknown; a full page means there may be more
+    if after is not None:
+        has_more = len(items) == filters.limit
+    else:
+        has_more = filters.offset + len(items) < total
 
-    return ItemList(
+    next_cursor = None
+    if has_more and items and search_service.supports_cursor(filters.q):
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+    result = ItemList(
         items=item_responses,
         total=total,
-        offset=filters.offset,
+        offset=filters.offset if after is None else 0,
         limit=filters.limit,
-        has_more=filters.offset + len(items) < total,
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
+    item_response_cache.set(cache_key, result)
+    return result
 
 
 # Import endpoints - placed here to avoid route conflicts
 
 
+async def _copy_items(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """
+    Write item rows with COPY on the session's connection and transaction.
+
+    Skips INSERT's per-statement parse/plan work for large imports. Row
+    triggers (search_document) still fire, and omitted columns get their
+    server defaults.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    async with raw_connection.driver_connection.cursor() as cursor:
+        async with cursor.copy(_ITEM_COPY_SQL) as copy:
+            for row in rows:
+                await copy.write_row(
+                    [
+                        Jsonb(value) if isinstance(value, dict) else value
+                        for value in map(row.get, _ITEM_COPY_COLUMNS)
+                    ]
+                )
+
+
 async def _perform_import(
     import_request: ImportRequest,
     principal: Principal,
@@ -243,120 +379,165 @@ async def _perform_import(
             detail="Cannot import more than 5000 items in a single batch",
         )
 
-    for parsed_item in parsed_items:
-        try:
-            # Validate the item type
-            if parsed_item.get("type") not in {
-                "flashcard",
-                "mcq",
-                "cloze",
-                "short_answer",
-            }:
+    # Work through the batch in chunks: each chunk gets one duplicate lookup and
+    # one flush, so the IN list and pending ORM objects stay bounded
+    existing_by_hash: dict[bytes, UUID] = {}
+    # Resolve each importable type's validator once, before the per-item loop
+    validators: dict[str, ItemTypeValidator] = {
+        item_type: item_type_registry.get(item_type)
+        for item_type in IMPORTABLE_ITEM_TYPES.intersection(
+            p.get("type") for p in parsed_items if isinstance(p.get("type"), str)
+        )
+    }
+    embedding_service = EmbeddingService(settings)
+    use_copy = (
+        len(parsed_items) >= IMPORT_COPY_THRESHOLD
+        and session.bind.dialect.driver == "psycopg"
+    )
+    for start in range(0, len(parsed_items), IMPORT_CHUNK_SIZE):
+        chunk = parsed_items[start : start + IMPORT_CHUNK_SIZE]
+
+        # Validate the chunk first so its duplicates can be looked up in one query
+        validated_items: list[tuple[dict[str, Any], dict[str, Any], bytes]] = []
+        for parsed_item in chunk:
+            try:
+                # Validate the item type
+                item_type = parsed_item.get("type")
+                if item_type not in IMPORTABLE_ITEM_TYPES:
+                    diagnostics.append(
+                        ImportDiagnostic(
+                            issue=f"Invalid item type: {item_type}",
+                            severity="error",
+                        )
+                    )
+                    total_errors += 1
+                    continue
+
+                # Validate payload using the appropriate validator
+                validated_payload = validators[item_type].validate(
+                    parsed_item["payload"]
+                )
+
+                # Generate content hash for duplicate detection
+                hash_value = content_hash(item_type, validated_payload)
+                validated_items.append((parsed_item, validated_payload, hash_value))
+
+            except ValueError as e:
+                # Validation error
                 diagnostics.append(
                     ImportDiagnostic(
-                        issue=f"Invalid item type: {parsed_item.get('type')}",
+                        issue=f"Validation error for {parsed_item.get('type', 'unknown')}: {str(e)}",
+                        severity="error",
+                    )
+                )
+                total_errors += 1
+            except Exception as e:
+                # Unexpected error
+                diagnostics.append(
+                    ImportDiagnostic(
+                        issue=f"Unexpected error for {parsed_item.get('type', 'unknown')}: {str(e)}",
                         severity="error",
                     )
                 )
                 total_errors += 1
-                continue
-
-            # Validate payload using the appropriate validator
-            validator = item_type_registry.get(parsed_item["type"])
-            validated_payload = validator.validate(parsed_item["payload"])
-
-            # Generate content hash and check for potential duplicates
-            hash_value = content_hash(parsed_item["type"], validated_payload)
 
-            # Check for existing items with same hash in same org
+        # Check for existing items with the same hashes in the same org; hashes
+        # seen in earlier chunks are already known
+        hashes = {h for _, _, h in validated_items if h not in existing_by_hash}
+        if hashes:
             existing_result = await session.execute(
-                select(Item).where(
+                select(Item.content_hash, Item.id).where(
                     and_(
                         Item.org_id == org_uuid,
-                        Item.content_hash == hash_value,
+                        Item.content_hash.in_(hashes),
                         Item.deleted_at.is_(None),
                     )
                 )
             )
+            existing_by_hash.update(existing_result.tuples().all())
 
-            existing_item = existing_result.scalar_one_or_none()
-            if existing_item:
-                warnings.append(
-                    f"Potential duplicate detected for {parsed_item['type']} (existing ID: {existing_item.id})"
+        # Semantic duplicates for the whole chunk: one embedding call, one query
+        similar_by_item: list[list[tuple[UUID, float]]] = [[] for _ in validated_items]
+        try:
+            async with session.begin_nested():
+                similar_by_item = await embedding_service.detect_duplicates_batch(
+                    session,
+                    org_uuid,
+                    [
+                        canonical_text(parsed_item["type"], validated_payload)
+                        for parsed_item, validated_payload, _ in validated_items
+                    ],
+                    threshold=0.90,
                 )
-
-            # Additional duplicate detection using embeddings (if available)
+        except Exception:
+            # Don't fail import if embedding-based duplicate detection fails
+            # This could happen if vectorizer is not available or other issues;
+            # the savepoint keeps the import transaction usable
+            pass
+
+        new_rows: list[dict[str, Any]] = []
+        for (parsed_item, validated_payload, hash_value), similar in zip(
+            validated_items, similar_by_item, strict=True
+        ):
             try:
-                embedding_service = EmbeddingService(settings)
-
-                # Create a temporary item object for duplicate detection
-                temp_item = Item(
-                    org_id=org_uuid,
-                    type=parsed_item["type"],
-                    payload=validated_payload,
-                    tags=parsed_item.get("tags", []),
-                )
-                temp_item.id = None  # Ensure it's not confused with existing item
-
-                # Check for semantic duplicates using embeddings
-                similar_items = await embedding_service.detect_duplicates(
-                    session, temp_item, threshold=0.90
-                )
+                existing_id = existing_by_hash.get(hash_value)
+                if existing_id:
+                    warnings.append(
+                        f"Potential duplicate detected for {parsed_item['type']} (existing ID: {existing_id})"
+                    )
 
-                for similar_item, similarity in similar_items:
+                # Additional duplicate detection using embeddings (if available)
+                for similar_id, similarity in similar:
                     warnings.append(
-                        f"High similarity ({similarity:.2f}) detected with item {similar_item.id} "
+                        f"High similarity ({similarity:.2f}) detected with item {similar_id} "
                         f"for {parsed_item['type']}"
                     )
 
-            except Exception:
-                # Don't fail import if embedding-based duplicate detection fails
-                # This could happen if vectorizer is not available or other issues
-                pass
-
-            # Create the item
-            item = Item(
-                org_id=org_uuid,
-                type=parsed_item["type"],
-                payload=validated_payload,
-                tags=parsed_item.get("tags", []),
-                difficulty=parsed_item.get("difficulty"),
-                source_id=import_request.source_id,
-                media={},  # Will be handled separately in future steps
-                meta={
-                    **(import_request.metadata or {}),
-                    **parsed_item.get("metadata", {}),
-                },
-                content_hash=hash_value,
-                created_by=principal.user_id,
-                status="draft",  # Always create as draft for staging
-            )
-
-            session.add(item)
-            await session.flush()  # Get the ID without committing
-            staged_ids.append(item.id)
-
-        except ValueError as e:
-            # Validation error
-            diagnostics.append(
-                ImportDiagnostic(
-                    issue=f"Validation error for {parsed_item.get('type', 'unknown')}: {str(e)}",
-                    severity="error",
-                )
-            )
-            total_errors += 1
-        except Exception as e:
-            # Unexpected error
-            diagnostics.append(
-                ImportDiagnostic(
-                    issue=f"Unexpected error for {parsed_item.get('type', 'unknown')}: {str(e)}",
-                    severity="error",
+                # Create the item; ids are assigned here so staging needs no flush
+                row = {
+                    "id": uuid4(),
+                    "org_id": org_uuid,
+                    "type": parsed_item["type"],
+                    "payload": validated_payload,
+                    "tags": parsed_item.get("tags", []),
+                    "difficulty": parsed_item.get("difficulty"),
+                    "source_id": import_request.source_id,
+                    "media": {},  # Will be handled separately in future steps
+                    "meta": {
+                        **(import_request.metadata or {}),
+                        **parsed_item.get("metadata", {}),
+                    },
+                    "content_hash": hash_value,
+                    "created_by": principal.user_id,
+                    "status": "draft",  # Always create as draft for staging
+                }
+
+                new_rows.append(row)
+                staged_ids.append(row["id"])
+
+                # Later items in this batch with the same content are duplicates too
+                existing_by_hash.setdefault(hash_value, row["id"])
+
+            except Exception as e:
+                # Unexpected error
+                diagnostics.append(
+                    ImportDiagnostic(
+                        issue=f"Unexpected error for {parsed_item.get('type', 'unknown')}: {str(e)}",
+                        severity="error",
+                    )
                 )
-            )
-            total_errors += 1
+                total_errors += 1
+
+        # Insert the chunk's items now; the transaction is committed once at the end
+        if use_copy:
+            await _copy_items(session, new_rows)
+        else:
+            session.add_all([Item(**row) for row in new_rows])
+            await session.flush()
 
-    # Commit all successful items
     await session.commit()
+    if staged_ids:
+        invalidate_org_items(org_uuid)
 
     result = ImportResult(
         staged_ids=staged_ids,
@@ -409,7 +590,26 @@ async def list_staged_items(
     # Force status to 'draft' for staged items
     filters.status = "draft"
 
-    return await list_items(filters, principal, session, settings)
+    return await _list_items(filters, principal, session, settings)
+
+
+async def _compute_approved_embeddings(
+    bind: AsyncEngine | AsyncConnection, settings: Settings, item_ids: list[UUID]
+) -> None:
+    """Compute embeddings for approved items on a session of their own."""
+    # Runs as a background task, after the request's session has been closed
+    async with AsyncSession(bind) as session:
+        items_result = await session.execute(select(Item).where(Item.id.in_(item_ids)))
+        embedding_service = EmbeddingService(settings)
+        for item in items_result.scalars().all():
+            try:
+                await embedding_service.compute_embedding_for_item(session, item)
+            except Exception:
+                # Don't fail approval if embedding computation fails
+                # This ensures the core functionality works even if embeddings are unavailable
+                pass
+
+        await session.commit()
 
 
 async def _perform_approval(
@@ -417,6 +617,7 @@ async def _perform_approval(
     principal: Principal,
     session: AsyncSession,
     settings: Settings,
+    background: BackgroundTasks,
 ) -> tuple[dict, int]:
     """Approve staged items by changing their status to published."""
 
@@ -425,81 +626,78 @@ async def _perform_approval(
     errors = {}
     org_uuid = principal.org_uuid
 
-    for item_id in approval_request.ids:
-        try:
-            # Get the item and verify it's in draft status
-            result = await session.execute(
-                select(Item).where(
-                    and_(
-                        Item.id == item_id,
-                        Item.org_id == org_uuid,
-                        Item.status == "draft",
-                        Item.deleted_at.is_(None),
-                    )
-                )
+    # Publish every requested draft with one UPDATE ... RETURNING
+    result = await session.execute(
+        update(Item)
+        .where(
+            and_(
+                Item.id.in_(approval_request.ids),
+                Item.org_id == org_uuid,
+                Item.status == "draft",
+                Item.deleted_at.is_(None),
             )
+        )
+        .values(status="published")
+        .returning(Item.id)
+        .execution_options(synchronize_session=False)
+    )
+    published = set(result.scalars().all())
+    await session.commit()
+    if published:
+        invalidate_org_items(org_uuid)
 
-            item = result.scalar_one_or_none()
-            if not item:
-                failed_ids.append(item_id)
-                errors[str(item_id)] = "Item not found or not in draft status"
-                continue
-
-            # Approve the item
-            item.status = "published"
+    # Report in request order; a repeated id only counts as approved once
+    for item_id in approval_request.ids:
+        if item_id in published:
+            published.discard(item_id)
             approved_ids.append(item_id)
-
-            # Compute embedding for newly published item
-            if settings.embeddings_async:
-                # Async embedding via job system
-                try:
-                    from api.v1.core.registries import vectorizer_registry
-                    from api.v1.infra.jobs.schemas import JobCreate
-                    from api.v1.infra.jobs.service import JobService
-
-                    job_service = JobService(settings)
-                    vectorizer = vectorizer_registry.get(settings.embeddings.value)
-
-                    # Generate dedupe key for idempotent job processing
-                    dedupe_key = job_service.generate_dedupe_key(
-                        "compute_item_embedding",
-                        item_id=str(item.id),
-                        model_version=vectorizer.get_model_version(),
-                    )
-
-                    job_create = JobCreate(
-                        type="compute_item_embedding",
-                        payload={
-                            "item_id": str(item.id),
-                            "model_version": vectorizer.get_model_version(),
-                            "force_recompute": False,
-                        },
-                        priority=3,  # Higher priority for item approvals
-                        dedupe_key=dedupe_key,
-                    )
-
-                    await job_service.enqueue_job(session, job_create, principal)
-
-                except Exception:
-                    # Don't fail approval if job enqueueing fails
-                    # This ensures the core functionality works even if jobs are unavailable
-                    pass
-            else:
-                # Sync embedding (legacy mode)
-                try:
-                    embedding_service = EmbeddingService(settings)
-                    await embedding_service.compute_embedding_for_item(session, item)
-                except Exception:
-                    # Don't fail approval if embedding computation fails
-                    # This ensures the core functionality works even if embeddings are unavailable
-                    pass
-
-        except Exception as e:
+        else:
             failed_ids.append(item_id)
-            errors[str(item_id)] = str(e)
+            errors[str(item_id)] = "Item not found or not in draft status"
 
-    # Commit all changes
-    await session.commit()
+    # Compute embeddings for newly published items
+    if approved_ids and settings.embeddings_async:
+        # Async embedding via job system
+        try:
+            from api.v1.core.registries import vectorizer_registry
+            from api.v1.infra.jobs.schemas import JobCreate
+            from api.v1.infra.jobs.service import JobService
+
+            job_service = JobService(settings)
+            model_version = vectorizer_registry.get(
+                settings.embeddings.value
+            ).get_model_version()
+
+            job_creates = [
+                JobCreate(
+                    type="compute_item_embedding",
+                    payload={
+                        "item_id": str(item_id),
+                        "model_version": model_version,
+                        "force_recompute": False,
+                    },
+                    priority=3,  # Higher priority for item approvals
+                    # Dedupe key for idempotent job processing
+                    dedupe_key=job_service.generate_dedupe_key(
+                        "compute_item_embedding",
+                        item_id=str(item_id),
+                        model_version=model_version,
+                    ),
+                )
+                for item_id in approved_ids
+            ]
+            await job_service.enqueue_many(session, job_creates, principal)
+
+        except Exception:
+            # Don't fail approval if job enqueueing fails
+            # This ensures the core functionality works even if jobs are unavailable
+            await session.rollback()
+    elif approved_ids:
+        # Sync embedding (legacy mode): computed after the response is sent, so
+        # approval latency does not grow with the number of items approved
+        background.add_task(
+            _compute_approved_embeddings, session.bind, settings, approved_ids
+        )
 
     result = ApprovalResult(
         approved_ids=approved_ids, failed_ids=failed_ids, errors=errors
@@ -512,6 +710,7 @@ async def _perform_approval(
 @router.post("/items/approve", response_model=ApprovalResult)
 async def approve_items(
     approval_request: ApprovalRequest,
+    background: BackgroundTasks,
     principal: Principal = PrincipalDep,
     session: AsyncSession = SessionDep,
     settings: Settings = SettingsDep,
@@ -530,6 +729,7 @@ async def approve_items(
         principal,
         session,
         settings,
+        background,
     )
 
     return ApprovalResult.model_validate(response_data)
@@ -542,8 +742,15 @@ async def get_item(
     session: AsyncSession = SessionDep,
 ):
     """Get a specific item by ID."""
+    cache_key = item_cache_key(principal.org_uuid, "item", item_id)
+    cached = item_response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     item = await get_item_by_id(item_id, principal, session)
-    return ItemResponse.model_validate(item)
+    response = ItemResponse.model_validate(item)
+    item_response_cache.set(cache_key, response)
+    return response
 
 
 @router.patch("/items/{item_id}", response_model=ItemResponse)
@@ -554,49 +761,66 @@ async def update_item(
     session: AsyncSession = SessionDep,
 ):
     """Update an existing item."""
-    item = await get_item_by_id(item_id, principal, session)
-
-    # Track if we need to regenerate the content hash
-    needs_rehash = False
+    values: dict[str, Any] = {}
 
-    # Update payload if provided
+    # Validating a new payload needs the item's type, so only that case loads
+    # the row first; every other field goes straight into the UPDATE below
     if update_data.payload is not None:
+        item = await get_item_by_id(item_id, principal, session)
         try:
             validator = item_type_registry.get(item.type)
             validated_payload = validator.validate(update_data.payload)
-            item.payload = validated_payload
-            needs_rehash = True
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
             ) from e
+        values["payload"] = validated_payload
+        values["content_hash"] = content_hash(item.type, validated_payload)
 
     # Update other fields
     if update_data.tags is not None:
-        item.tags = update_data.tags
-        needs_rehash = True
+        values["tags"] = update_data.tags
 
-    if update_data.difficulty is not None:
-        item.difficulty = update_data.difficulty
+    # Content changes bump the version; done in SQL so concurrent updates
+    # cannot lose an increment. Tags are not part of the content hash.
+    if update_data.payload is not None or update_data.tags is not None:
+        values["version"] = Item.version + 1
 
-    if update_data.media is not None:
-        item.media = update_data.media
+    for field in ("difficulty", "media", "meta", "status"):
+        value = getattr(update_data, field)
+        if value is not None:
+            values[field] = value
 
-    if update_data.meta is not None:
-        item.meta = update_data.meta
-
-    if update_data.status is not None:
-        item.status = update_data.status
+    if not values:
+        return ItemResponse.model_validate(
+            await get_item_by_id(item_id, principal, session)
+        )
 
-    # Regenerate content hash if content changed
-    if needs_rehash:
-        item.content_hash = content_hash(item.type, item.payload)
-        item.version += 1
+    # One UPDATE ... RETURNING: no separate SELECT or refresh round trip
+    result = await session.execute(
+        update(Item)
+        .where(
+            and_(
+                Item.id == item_id,
+                Item.org_id == principal.org_uuid,
+                Item.deleted_at.is_(None),
+            )
+        )
+        .values(**values)
+        .returning(Item)
+        .execution_options(populate_existing=True)
+    )
+    item = result.scalar_one_or_none()
+    if item is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Item not found"
+        )
 
+    response = ItemResponse.model_validate(item)
     await session.commit()
-    await session.refresh(item)
+    invalidate_org_items(principal.org_uuid)
 
-    return ItemResponse.model_validate(item)
+    return response
 
 
 @router.delete("/items/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -606,14 +830,27 @@ async def delete_item(
     session: AsyncSession = SessionDep,
 ):
     """Soft delete an item."""
-    item = await get_item_by_id(item_id, principal, session)
-
-    # Soft delete by setting deleted_at timestamp
-    from datetime import datetime
-
-    item.deleted_at = datetime.utcnow()
+    # Soft delete by stamping deleted_at in the database; no need to load the row
+    result = await session.execute(
+        update(Item)
+        .where(
+            and_(
+                Item.id == item_id,
+                Item.org_id == principal.org_uuid,
+                Item.deleted_at.is_(None),
+            )
+        )
+        .values(deleted_at=func.now())
+        .returning(Item.id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Item not found"
+        )
 
     await session.commit()
+    invalidate_org_items(principal.org_uuid)
 
 
 @router.post("/items/{item_id}/render", response_model=dict[str, Any])
@@ -625,15 +862,17 @@ async def render_item(
     """Render an item for display/practice."""
     item = await get_item_by_id(item_id, principal, session)
 
-    try:
-        validator = item_type_registry.get(item.type)
-        rendered = validator.render(item.payload)
-        return rendered
-    except KeyError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"No validator found for item type: {item.type}",
-        ) from e
+    renderer = _renderers.get(item.type)
+    if renderer is None:
+        try:
+            renderer = _renderers[item.type] = item_type_registry.get(item.type).render
+        except KeyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"No validator found for item type: {item.type}",
+            ) from e
+
+    return renderer(item.payload)
 
 
 @router.get("/items/{item_id}/similar", response_model=list[dict[str, Any]])
@@ -654,12 +893,20 @@ async def find_similar_items(
             session, item, threshold, limit
         )
 
+        # Convert every match in one adapter pass and dump straight to JSON
+        # types, so the dict response model has nothing left to encode
+        item_responses = _item_list_adapter.dump_python(
+            _item_list_adapter.validate_python(
+                [similar_item for similar_item, _ in similar_items],
+                from_attributes=True,
+            ),
+            mode="json",
+        )
         return [
-            {
-                "item": ItemResponse.model_validate(similar_item).model_dump(),
-                "similarity_score": float(similarity),
-            }
-            for similar_item, similarity in similar_items
+            {"item": item_response, "similarity_score": float(similarity)}
+            for item_response, (_, similarity) in zip(
+                item_responses, similar_items, strict=True
+            )
         ]
     except Exception as e:
         raise HTTPException(
@@ -66,6 +66,12 @@ class ItemResponse(BaseModel):
     created_at: datetime
     deleted_at: datetime | None
 
+    @field_validator("content_hash", mode="before")
+    @classmethod
+    def hex_content_hash(cls, v):
+        # Stored as the raw digest; exposed as hex as before
+        return v.hex() if isinstance(v, bytes) else v
+
     class Config:
         from_attributes = True
 
@@ -110,6 +116,7 @@ class ItemList(BaseModel):
     offset: int
     limit: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class ItemFilters(BaseModel):
@@ -128,6 +135,10 @@ class ItemFilters(BaseModel):
         default=50, ge=1, le=1000, description="Number of items to return"
     )
     offset: int = Field(default=0, ge=0, description="Number of items to skip")
+    cursor: str | None = Field(
+        default=None,
+        description="Resume after this cursor (next_cursor of the previous page)",
+    )
 
     @field_validator("q")
     @classmethod
@@ -146,7 +157,8 @@ class ItemFilters(BaseModel):
     @field_validator("type", "status", "difficulty")
     @classmethod
     def validate_filter_strings(cls, v):
-        return v.strip().lower() if v and isinstance(v, str) else v
+        # After-validators run once the value is known to be str | None
+        return v.strip().lower() if v else v
 
 
 # Import-related schemas
@@ -1,5 +1,95 @@
+import base64
+import binascii
 import hashlib
+from datetime import datetime
 from typing import Any
+from uuid import UUID
+
+
+def _flashcard_text(payload: dict[str, Any]) -> str:
+    parts = [payload.get("front", ""), payload.get("back", "")]
+
+    # Add examples and hints if present
+    if payload.get("examples"):
+        parts.extend(payload["examples"])
+    if payload.get("hints"):
+        parts.extend(payload["hints"])
+    if payload.get("pronunciation"):
+        parts.append(payload["pronunciation"])
+
+    return " ".join(parts).strip()
+
+
+def _mcq_text(payload: dict[str, Any]) -> str:
+    parts = [payload.get("stem", "")]
+
+    # Add all option text
+    if payload.get("options"):
+        for option in payload["options"]:
+            parts.append(option.get("text", ""))
+            if option.get("rationale"):
+                parts.append(option["rationale"])
+
+    return " ".join(parts).strip()
+
+
+def _cloze_text(payload: dict[str, Any]) -> str:
+    parts = [payload.get("text", "")]
+
+    # Add all blank answers
+    if payload.get("blanks"):
+        for blank in payload["blanks"]:
+            if blank.get("answers"):
+                parts.extend(blank["answers"])
+            if blank.get("alt_answers"):
+                parts.extend(blank["alt_answers"])
+
+    if payload.get("context_note"):
+        parts.append(payload["context_note"])
+
+    return " ".join(parts).strip()
+
+
+def _short_answer_text(payload: dict[str, Any]) -> str:
+    parts = [payload.get("prompt", "")]
+
+    expected = payload.get("expected", {})
+    if expected.get("value"):
+        parts.append(expected["value"])
+    if expected.get("unit"):
+        parts.append(expected["unit"])
+
+    if payload.get("acceptable_patterns"):
+        parts.extend(payload["acceptable_patterns"])
+
+    return " ".join(parts).strip()
+
+
+def _generic_text(payload: Any) -> str:
+    # Fallback: join all string values in the payload, in document order.
+    # Walks with an explicit stack (children pushed in reverse) rather than
+    # recursing, so deeply nested payloads cannot hit the recursion limit.
+    strings = []
+    stack = [payload]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, str):
+            strings.append(obj)
+        elif isinstance(obj, dict):
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+
+    return " ".join(strings).strip()
+
+
+# Text extractor per item type; unknown types use _generic_text
+_CANONICAL_TEXT = {
+    "flashcard": _flashcard_text,
+    "mcq": _mcq_text,
+    "cloze": _cloze_text,
+    "short_answer": _short_answer_text,
+}
 
 
 def canonical_text(item_type: str, payload: dict[str, Any]) -> str:
@@ -13,79 +103,10 @@ def canonical_text(item_type: str, payload: dict[str, Any]) -> str:
     Returns:
         Canonical text representation of the item content
     """
-    if item_type == "flashcard":
-        parts = [payload.get("front", ""), payload.get("back", "")]
-
-        # Add examples and hints if present
-        if payload.get("examples"):
-            parts.extend(payload["examples"])
-        if payload.get("hints"):
-            parts.extend(payload["hints"])
-        if payload.get("pronunciation"):
-            parts.append(payload["pronunciation"])
-
-        return " ".join(parts).strip()
-
-    elif item_type == "mcq":
-        parts = [payload.get("stem", "")]
-
-        # Add all option text
-        if payload.get("options"):
-            for option in payload["options"]:
-                parts.append(option.get("text", ""))
-                if option.get("rationale"):
-                    parts.append(option["rationale"])
-
-        return " ".join(parts).strip()
-
-    elif item_type == "cloze":
-        parts = [payload.get("text", "")]
-
-        # Add all blank answers
-        if payload.get("blanks"):
-            for blank in payload["blanks"]:
-                if blank.get("answers"):
-                    parts.extend(blank["answers"])
-                if blank.get("alt_answers"):
-                    parts.extend(blank["alt_answers"])
-
-        if payload.get("context_note"):
-            parts.append(payload["context_note"])
-
-        return " ".join(parts).strip()
-
-    elif item_type == "short_answer":
-        parts = [payload.get("prompt", "")]
-
-        expected = payload.get("expected", {})
-        if expected.get("value"):
-            parts.append(expected["value"])
-        if expected.get("unit"):
-            parts.append(expected["unit"])
-
-        if payload.get("acceptable_patterns"):
-            parts.extend(payload["acceptable_patterns"])
-
-        return " ".join(parts).strip()
-
-    else:
-        # Fallback: join all string values in the payload
-        def extract_strings(obj):
-            strings = []
-            if isinstance(obj, str):
-                strings.append(obj)
-            elif isinstance(obj, dict):
-                for value in obj.values():
-                    strings.extend(extract_strings(value))
-            elif isinstance(obj, list):
-                for item in obj:
-                    strings.extend(extract_strings(item))
-            return strings
-
-        return " ".join(extract_strings(payload)).strip()
-
-
-def content_hash(item_type: str, payload: dict[str, Any]) -> str:
+    return _CANONICAL_TEXT.get(item_type, _generic_text)(payload)
+
+
+def content_hash(item_type: str, payload: dict[str, Any]) -> bytes:
     """
     Generate a content hash for an item based on its canonical text.
 
@@ -94,18 +115,16 @@ def content_hash(item_type: str, payload: dict[str, Any]) -> str:
         payload: The item payload
 
     Returns:
-        SHA-256 hash of the canonical text (lowercase, 64 characters)
+        Raw SHA-256 digest of the canonical text (32 bytes; stored as BYTEA)
     """
     canonical = canonical_text(item_type, payload)
 
     # Normalize the canonical text for consistent hashing
     normalized = canonical.lower().strip()
 
-    # Create SHA-256 hash
-    hasher = hashlib.sha256()
-    hasher.update(normalized.encode("utf-8"))
-
-    return hasher.hexdigest()
+    # SHA-256 runs on the CPU's SHA extensions via OpenSSL; for item-sized
+    # text it is as fast as BLAKE2/3, and stored hashes stay comparable
+    return hashlib.sha256(normalized.encode("utf-8")).digest()
 
 
 def normalize_tags(tags: list[str] | None) -> list[str]:
@@ -121,18 +140,10 @@ def normalize_tags(tags: list[str] | None) -> list[str]:
     if not tags:
         return []
 
-    normalized = []
-    seen = set()
-
-    for tag in tags:
-        if isinstance(tag, str):
-            # Strip whitespace, lowercase, and remove empty tags
-            clean_tag = tag.strip().lower()
-            if clean_tag and clean_tag not in seen:
-                normalized.append(clean_tag)
-                seen.add(clean_tag)
-
-    return sorted(normalized)  # Sort for consistency
+    # Strip whitespace, lowercase, drop empty tags; the set dedupes and
+    # sorting gives a consistent order
+    cleaned = (tag.strip().lower() for tag in tags if isinstance(tag, str))
+    return sorted({tag for tag in cleaned if tag})
 
 
 def validate_difficulty(difficulty: str | None) -> str | None:
@@ -161,3 +172,39 @@ def validate_difficulty(difficulty: str | None) -> str | None:
     raise ValueError(
         f"Invalid difficulty level: {difficulty}. Must be one of {valid_levels}"
     )
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """
+    Encode the position of the last item on a page as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last item returned
+        item_id: ID of the last item returned (tie-breaker)
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at, item_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, item_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
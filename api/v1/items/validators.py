@@ -1,7 +1,10 @@
+import re
 from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from api.v1.core.cache import compile_user_pattern
+
 
 class FlashcardPayload(BaseModel):
     """Flashcard item payload validator."""
@@ -144,11 +147,9 @@ class ShortAnswerPayload(BaseModel):
     @classmethod
     def validate_patterns(cls, v):
         if v is not None:
-            import re
-
             for pattern in v:
                 try:
-                    re.compile(pattern)
+                    compile_user_pattern(pattern)
                 except re.error as e:
                     raise ValueError(f"Invalid regex pattern '{pattern}': {e}") from e
         return v
@@ -6,6 +6,8 @@ Provides objective scoring with partial credit support.
 import re
 from typing import Any
 
+from api.v1.core.cache import compile_user_pattern
+
 
 class MCQGrader:
     """Grader for multiple choice questions with exact/partial scoring."""
@@ -197,7 +199,7 @@ class ShortAnswerGrader:
             # Check against regex patterns
             for pattern in acceptable_patterns:
                 try:
-                    if re.match(pattern, user_answer, re.IGNORECASE):
+                    if compile_user_pattern(pattern, re.IGNORECASE).match(user_answer):
                         is_correct = True
                         break
                 except re.error:
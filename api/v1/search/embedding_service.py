@@ -17,6 +17,23 @@ from api.v1.items.models import Item
 from api.v1.items.utils import canonical_text
 from api.v1.search.models import ItemEmbedding
 
+# Top 10 stored neighbours per query vector, as in detect_duplicates
+_BATCH_DUPLICATES_SQL = text("""
+    SELECT q.ord, s.id, s.similarity
+    FROM unnest(CAST(:vectors AS text[])) WITH ORDINALITY AS q(vec, ord)
+    CROSS JOIN LATERAL (
+        SELECT items.id,
+               1 - (item_embeddings.embedding <=> q.vec::vector) AS similarity
+        FROM items
+        JOIN item_embeddings ON item_embeddings.item_id = items.id
+        WHERE items.org_id = :org_id AND items.deleted_at IS NULL
+        ORDER BY item_embeddings.embedding <=> q.vec::vector
+        LIMIT 10
+    ) AS s
+    WHERE s.similarity >= :threshold
+    ORDER BY q.ord, s.similarity DESC
+    """)
+
 
 class EmbeddingService:
     """
@@ -213,6 +230,51 @@ class EmbeddingService:
         result = await session.execute(query)
         return [(row[0], float(row[1])) for row in result.all()]
 
+    async def detect_duplicates_batch(
+        self,
+        session: AsyncSession,
+        org_id: UUID,
+        texts: list[str],
+        threshold: float = 0.90,
+    ) -> list[list[tuple[UUID, float]]]:
+        """
+        Detect potential duplicates for several new items at once.
+
+        Embeds all texts in one vectorizer call and finds each one's nearest
+        stored embeddings in the org with a single query.
+
+        Args:
+            session: Database session
+            org_id: Organization whose items are searched
+            texts: Canonical texts of the new items
+            threshold: Minimum cosine similarity for duplicate detection
+
+        Returns:
+            One list of (item_id, similarity_score) tuples per input text,
+            most similar first
+        """
+        if not texts:
+            return []
+
+        vectorizer = vectorizer_registry.get(self.settings.embeddings.value)
+        vectors = vectorizer.vectorize_batch(texts)
+
+        # Vectors travel as pgvector text literals; the LATERAL subquery's
+        # ORDER BY distance LIMIT lets the HNSW index serve each lookup
+        result = await session.execute(
+            _BATCH_DUPLICATES_SQL,
+            {
+                "vectors": ["[" + ",".join(map(str, v)) + "]" for v in vectors],
+                "org_id": org_id,
+                "threshold": threshold,
+            },
+        )
+
+        matches: list[list[tuple[UUID, float]]] = [[] for _ in texts]
+        for ordinality, item_id, similarity in result.all():
+            matches[ordinality - 1].append((item_id, float(similarity)))
+        return matches
+
     async def get_embedding_stats(
         self, session: AsyncSession, org_id: UUID | None = None
     ) -> dict[str, Any]:
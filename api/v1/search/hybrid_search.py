@@ -4,12 +4,14 @@ Hybrid search implementation combining keyword and vector similarity.
 Implements 2024-2025 best practices for hybrid ranking with configurable weights.
 """
 
+import asyncio
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Text, and_, func, or_, select, text
+from sqlalchemy import ColumnElement, Row, and_, func, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer
 
 from api.config.settings import Settings
 from api.v1.core.registries import vectorizer_registry
@@ -17,6 +19,20 @@ from api.v1.items.models import Item
 from api.v1.items.utils import canonical_text
 from api.v1.search.models import ItemEmbedding
 
+# Total matching rows, attached to every row of a page query
+_TOTAL = func.count().over().label("total")
+
+# Item responses (ItemResponse) never read Item.source or the tsvector, so
+# skip the extra SELECT for sources and the per-row search_document transfer
+_LIST_LOAD = defer(Item.search_document)
+
+# Columns selected for list pages. Pages are returned as plain rows, which
+# ItemResponse validates by attribute like ORM objects, so listing skips ORM
+# instance construction and identity-map bookkeeping for every row
+_LIST_COLUMNS = tuple(
+    column for column in Item.__table__.c if column.key != "search_document"
+)
+
 
 class HybridSearchService:
     """
@@ -30,7 +46,7 @@ class HybridSearchService:
         self.settings = settings
         self.keyword_weight = 0.3  # Weight for keyword/BM25 score
         self.vector_weight = 0.7  # Weight for vector similarity
-        self.use_tsvector = settings.environment in ("production", "staging")
+        self.use_vectors = settings.environment in ("production", "staging")
 
     async def search_items(
         self,
@@ -40,7 +56,8 @@ class HybridSearchService:
         filters: dict[str, Any] | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[Item], int]:
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[Row], int]:
         """
         Perform hybrid search combining keyword and vector similarity.
 
@@ -51,9 +68,12 @@ class HybridSearchService:
             filters: Additional filters (type, status, etc.)
             limit: Maximum results to return
             offset: Results offset for pagination
+            after: (created_at, id) of the last item already seen; replaces
+                offset on paths that support cursors (see supports_cursor)
 
         Returns:
-            Tuple of (items, total_count)
+            Tuple of (item rows, total_count); rows carry the item columns
+            (everything but search_document) as attributes
         """
         # Base conditions
         base_conditions = [
@@ -74,9 +94,15 @@ class HybridSearchService:
             if filters.get("created_by"):
                 base_conditions.append(Item.created_by == filters["created_by"])
             if filters.get("tags"):
-                # Match items that have ANY of the specified tags
-                tag_conditions = [Item.tags.contains([tag]) for tag in filters["tags"]]
-                base_conditions.append(or_(*tag_conditions))
+                # Match items that have ANY of the specified tags; one && test
+                # that items_tags_gin serves, rather than an OR of @> tests
+                base_conditions.append(Item.tags.overlap(filters["tags"]))
+
+        # Keyset pagination: resume strictly after the cursor position
+        keyset = None
+        if after is not None and self.supports_cursor(query):
+            keyset = tuple_(Item.created_at, Item.id) < tuple_(*after)
+            offset = 0
 
         # Build query based on search type
         if query:
@@ -85,9 +111,13 @@ class HybridSearchService:
             )
         else:
             return await self._filter_only_search(
-                session, base_conditions, limit, offset
+                session, base_conditions, limit, offset, keyset
             )
 
+    def supports_cursor(self, query: str | None) -> bool:
+        """Whether results for this query are ordered by (created_at, id)."""
+        return not query
+
     async def _hybrid_search(
         self,
         session: AsyncSession,
@@ -95,147 +125,136 @@ class HybridSearchService:
         query: str,
         limit: int,
         offset: int,
-    ) -> tuple[list[Item], int]:
+    ) -> tuple[list[Row], int]:
         """Perform hybrid search with both keyword and vector scoring."""
 
-        if self.use_tsvector:
-            # Production: Use tsvector + vector similarity
-            return await self._production_hybrid_search(
-                session, base_conditions, query, limit, offset
-            )
-        else:
-            # Development: Use ILIKE fallback
-            return await self._dev_hybrid_search(
-                session, base_conditions, query, limit, offset
-            )
+        # Parse the query once, as a FROM item shared by the match and the rank.
+        # websearch_to_tsquery accepts free text (quotes, OR, -word) without
+        # raising on stray tsquery operators the way to_tsquery does.
+        tsq = func.websearch_to_tsquery("english", query).column_valued("tsq")
 
-    async def _production_hybrid_search(
-        self,
-        session: AsyncSession,
-        base_conditions: list,
-        query: str,
-        limit: int,
-        offset: int,
-    ) -> tuple[list[Item], int]:
-        """Production hybrid search with tsvector and pgvector."""
-
-        # Get query embedding
-        vectorizer = vectorizer_registry.get(self.settings.embeddings.value)
-        query_embedding = vectorizer.vectorize(query)
-
-        # Build hybrid query with both keyword and vector scoring
-        search_condition = Item.search_document.op("@@")(
-            func.to_tsquery("english", query)
-        )
+        # search_document is kept current by a trigger in every environment and
+        # GIN-indexed, so matching never falls back to scanning payloads
+        search_condition = Item.search_document.op("@@")(tsq)
         all_conditions = base_conditions + [search_condition]
 
-        # Calculate keyword rank
-        keyword_rank = func.ts_rank_cd(
-            Item.search_document, func.to_tsquery("english", query)
-        )
-
-        # Calculate vector similarity (cosine distance)
-        vector_similarity = func.coalesce(
-            text("1 - (item_embeddings.embedding <=> :query_vector)"), text("0")
-        ).params(query_vector=query_embedding)
+        # Calculate keyword rank; search_document is stored pre-weighted
+        # (content A, tags B, type C), so no per-row setweight is needed
+        keyword_rank = func.ts_rank_cd(Item.search_document, tsq)
 
-        # Hybrid score: weighted combination
-        hybrid_score = (
-            self.keyword_weight * keyword_rank + self.vector_weight * vector_similarity
-        ).label("hybrid_score")
+        if self.use_vectors:
+            # Get query embedding
+            vectorizer = vectorizer_registry.get(self.settings.embeddings.value)
+            query_embedding = vectorizer.vectorize(query)
+
+            # Calculate vector similarity (cosine distance)
+            vector_similarity = func.coalesce(
+                text("1 - (item_embeddings.embedding <=> :query_vector)"), text("0")
+            ).params(query_vector=query_embedding)
+
+            # Hybrid score: weighted combination
+            hybrid_score = (
+                self.keyword_weight * keyword_rank
+                + self.vector_weight * vector_similarity
+            ).label("hybrid_score")
+            from_clause = Item.__table__.outerjoin(ItemEmbedding.__table__)
+        else:
+            # Development/test: keyword rank only, as before
+            hybrid_score = keyword_rank.label("hybrid_score")
+            from_clause = Item.__table__
 
-        # Main query with left join to embeddings
         query_stmt = (
-            select(Item, hybrid_score)
-            .select_from(Item.__table__.outerjoin(ItemEmbedding.__table__))
+            select(*_LIST_COLUMNS, hybrid_score, _TOTAL)
+            .select_from(from_clause)
             .where(and_(*all_conditions))
             .order_by(text("hybrid_score DESC"), Item.created_at.desc())
             .offset(offset)
             .limit(limit)
-            .options(selectinload(Item.source))
         )
 
-        # Get total count
+        # Total count, only needed when the page comes back empty
         count_query = (
             select(func.count(Item.id))
-            .select_from(Item.__table__.outerjoin(ItemEmbedding.__table__))
+            .select_from(from_clause)
             .where(and_(*all_conditions))
         )
 
-        # Execute queries
-        result = await session.execute(query_stmt)
-        count_result = await session.execute(count_query)
-
-        items = [row[0] for row in result.all()]
-        total = count_result.scalar()
-
-        return items, total
+        return await self._fetch_page(session, query_stmt, count_query, offset)
 
-    async def _dev_hybrid_search(
+    async def _filter_only_search(
         self,
         session: AsyncSession,
         base_conditions: list,
-        query: str,
         limit: int,
         offset: int,
-    ) -> tuple[list[Item], int]:
-        """Development hybrid search with ILIKE fallback."""
-
-        search_text = f"%{query}%"
-        search_condition = or_(
-            func.cast(Item.payload, Text).ilike(search_text),
-            func.array_to_string(Item.tags, " ").ilike(search_text),
-            Item.type.ilike(search_text),
-        )
-        all_conditions = base_conditions + [search_condition]
-
-        # Simple query without vector similarity in dev
-        query_stmt = (
-            select(Item)
-            .where(and_(*all_conditions))
-            .order_by(Item.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .options(selectinload(Item.source))
-        )
-
-        count_query = select(func.count(Item.id)).where(and_(*all_conditions))
-
-        result = await session.execute(query_stmt)
-        count_result = await session.execute(count_query)
-
-        items = result.scalars().all()
-        total = count_result.scalar()
+        keyset: ColumnElement[bool] | None = None,
+    ) -> tuple[list[Row], int]:
+        """Search without query - just filtering and sorting."""
 
-        return items, total
+        return await self._recent_page(session, base_conditions, limit, offset, keyset)
 
-    async def _filter_only_search(
+    async def _recent_page(
         self,
         session: AsyncSession,
-        base_conditions: list,
+        conditions: list,
         limit: int,
         offset: int,
-    ) -> tuple[list[Item], int]:
-        """Search without query - just filtering and sorting."""
+        keyset: ColumnElement[bool] | None,
+    ) -> tuple[list[Row], int]:
+        """Page through matches newest first, by offset or by keyset cursor."""
+
+        count_query = select(func.count(Item.id)).where(and_(*conditions))
+
+        if keyset is not None:
+            # No window count here: it would have to visit every row after the
+            # cursor, while the page itself only reads `limit` index entries
+            query_stmt = (
+                select(*_LIST_COLUMNS)
+                .where(and_(*conditions, keyset))
+                .order_by(Item.created_at.desc(), Item.id.desc())
+                .limit(limit)
+            )
+            result, total = await asyncio.gather(
+                session.execute(query_stmt), self._count(session, count_query)
+            )
+            return list(result.all()), total
 
         query_stmt = (
-            select(Item)
-            .where(and_(*base_conditions))
-            .order_by(Item.created_at.desc())
+            select(*_LIST_COLUMNS, _TOTAL)
+            .where(and_(*conditions))
+            .order_by(Item.created_at.desc(), Item.id.desc())
             .offset(offset)
             .limit(limit)
-            .options(selectinload(Item.source))
         )
 
-        count_query = select(func.count(Item.id)).where(and_(*base_conditions))
+        return await self._fetch_page(session, query_stmt, count_query, offset)
 
-        result = await session.execute(query_stmt)
-        count_result = await session.execute(count_query)
+    async def _count(self, session: AsyncSession, count_query) -> int:
+        """
+        Run a count on its own connection so it overlaps the page query.
 
-        items = result.scalars().all()
-        total = count_result.scalar()
+        An AsyncSession runs one statement at a time on its connection, so a
+        second session on the same engine is what lets the two run in parallel.
+        """
+        async with AsyncSession(session.bind) as count_session:
+            return (await count_session.execute(count_query)).scalar()
+
+    async def _fetch_page(
+        self, session: AsyncSession, query_stmt, count_query, offset: int
+    ) -> tuple[list[Row], int]:
+        """
+        Run a page query whose rows carry the match count in a ``total`` column.
 
-        return items, total
+        COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so one execution
+        returns both the page and the total. An empty page has no row to carry
+        it; past the first page that needs the separate count query.
+        """
+        rows = (await session.execute(query_stmt)).all()
+        if rows:
+            return list(rows), rows[0].total
+        if offset == 0:
+            return [], 0
+        return [], (await session.execute(count_query)).scalar()
 
     async def find_similar_items(
         self,
@@ -256,10 +275,13 @@ class HybridSearchService:
         Returns:
             List of (item, similarity_score) tuples
         """
-        # Get or generate embedding for reference item
-        if item.embedding:
-            reference_embedding = item.embedding.embedding
-        else:
+        # Get or generate embedding for reference item. Read the column directly:
+        # touching item.embedding would be a lazy load, which async sessions
+        # cannot perform implicitly
+        reference_embedding = await session.scalar(
+            select(ItemEmbedding.embedding).where(ItemEmbedding.item_id == item.id)
+        )
+        if reference_embedding is None:
             # Generate embedding on-the-fly
             vectorizer = vectorizer_registry.get(self.settings.embeddings.value)
             item_text = canonical_text(item.type, item.payload)
@@ -283,6 +305,7 @@ class HybridSearchService:
             )
             .order_by(text("similarity DESC"))
             .limit(limit)
+            .options(_LIST_LOAD)
         )
 
         result = await session.execute(query_stmt)
@@ -53,6 +53,10 @@ class StubVectorizer:
 
         return vector
 
+    def vectorize_batch(self, texts: list[str]) -> list[list[float]]:
+        """Create vectors for several texts."""
+        return [self.vectorize(text) for text in texts]
+
     def get_dimension(self) -> int:
         """Return vector dimension (768 for compatibility)."""
         return 768
@@ -100,6 +104,15 @@ class SentenceBERTVectorizer:
         # Convert numpy array to list
         return embedding.tolist()
 
+    def vectorize_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in batched forward passes."""
+        model = self._get_model()
+
+        embeddings = model.encode(
+            texts, batch_size=64, convert_to_tensor=False, normalize_embeddings=True
+        )
+        return embeddings.tolist()
+
     def get_dimension(self) -> int:
         """Return vector dimension (384 for all-MiniLM-L6-v2)."""
         return 384
@@ -152,6 +165,21 @@ class OpenAIVectorizer:
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}") from e
 
+    def vectorize_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one API request."""
+        client = self._get_client()
+
+        try:
+            response = client.embeddings.create(
+                model=self._model_name, input=texts, encoding_format="float"
+            )
+            return [
+                data.embedding
+                for data in sorted(response.data, key=lambda data: data.index)
+            ]
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
+
     def get_dimension(self) -> int:
         """Return vector dimension (1536 for text-embedding-3-small)."""
         return 1536
@@ -0,0 +1,63 @@
+"""add partial indexes for job claiming and stuck job recovery
+
+Revision ID: 27ec28abf025
+Revises: 497f2e114700
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "27ec28abf025"
+down_revision: Union[str, Sequence[str], None] = "497f2e114700"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial indexes scoped to the queued and running job sets."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Worker claim query: status='queued' AND run_at <= now()
+        # ORDER BY priority, run_at. Covering id keeps it an index-only scan.
+        op.create_index(
+            "ix_jobs_queue_ready",
+            "jobs",
+            ["priority", "run_at"],
+            postgresql_include=["id"],
+            postgresql_where=sa.text("status = 'queued'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Stuck job recovery: status='running' AND heartbeat_at < cutoff
+        op.create_index(
+            "ix_jobs_running_heartbeat",
+            "jobs",
+            ["heartbeat_at"],
+            postgresql_where=sa.text("status = 'running'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial job indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_running_heartbeat",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_jobs_queue_ready",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
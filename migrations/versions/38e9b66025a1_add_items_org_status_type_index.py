@@ -0,0 +1,59 @@
+"""add composite (org_id, status, type) index on items
+
+Revision ID: 38e9b66025a1
+Revises: e6561474ce07
+Create Date: 2026-10-17 14:58:09.114375
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "38e9b66025a1"
+down_revision: Union[str, Sequence[str], None] = "e6561474ce07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace items_org_status_idx with an (org_id, status, type) index."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Item lists filter org + status + type together; the old
+        # (org_id, status) index is a prefix of the new one. items_org_type_idx
+        # stays for lists filtered by type without a status.
+        op.create_index(
+            "items_org_status_type_idx",
+            "items",
+            ["org_id", "status", "type"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "items_org_status_idx",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore items_org_status_idx and drop the composite index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "items_org_status_idx",
+            "items",
+            ["org_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "items_org_status_type_idx",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
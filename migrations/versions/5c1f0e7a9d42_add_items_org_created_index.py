@@ -0,0 +1,43 @@
+"""add (org_id, created_at, id) index on items for keyset pagination
+
+Revision ID: 5c1f0e7a9d42
+Revises: 38e9b66025a1
+Create Date: 2026-10-17 15:42:51.308214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1f0e7a9d42"
+down_revision: Union[str, Sequence[str], None] = "38e9b66025a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index items by org in (created_at, id) order."""
+    # Item lists page newest first with WHERE (created_at, id) < cursor; a
+    # backward scan of this index reads only the requested page.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "items_org_created_idx",
+            "items",
+            ["org_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "items_org_created_idx",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,55 @@
+"""add jobs_ready notify trigger for worker wakeups
+
+Revision ID: b94f82918f95
+Revises: 27ec28abf025
+Create Date: 2026-10-17 11:40:03.502117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b94f82918f95"
+down_revision: Union[str, Sequence[str], None] = "27ec28abf025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Notify LISTENing workers whenever a job becomes queued."""
+    # Fires on new jobs and on transitions back to queued (retries, stuck job
+    # recovery, manual retry). Postgres collapses identical notifications
+    # within a transaction, so bulk enqueues send one message per org.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION jobs_notify_ready()
+        RETURNS trigger AS $$
+        BEGIN
+            IF NEW.status = 'queued'
+               AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM 'queued') THEN
+                PERFORM pg_notify('jobs_ready', NEW.org_id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """
+    )
+
+    op.execute("DROP TRIGGER IF EXISTS jobs_notify_ready_trigger ON jobs;")
+    op.execute(
+        """
+        CREATE TRIGGER jobs_notify_ready_trigger
+            AFTER INSERT OR UPDATE OF status ON jobs
+            FOR EACH ROW EXECUTE FUNCTION jobs_notify_ready();
+    """
+    )
+
+
+def downgrade() -> None:
+    """Drop the notify trigger and its function."""
+    op.execute("DROP TRIGGER IF EXISTS jobs_notify_ready_trigger ON jobs;")
+    op.execute("DROP FUNCTION IF EXISTS jobs_notify_ready();")
@@ -0,0 +1,62 @@
+"""convert core entity json columns to jsonb
+
+Revision ID: e6561474ce07
+Revises: ec632b333d82
+Create Date: 2026-10-17 14:31:52.406618
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6561474ce07"
+down_revision: Union[str, Sequence[str], None] = "ec632b333d82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = {
+    "orgs": ["meta"],
+    "users": ["meta"],
+    "sources": ["meta"],
+    "media_assets": ["meta"],
+    "items": ["payload", "media", "meta"],
+}
+
+
+def _alter_json_columns(target_type: str) -> None:
+    for table, columns in JSON_COLUMNS.items():
+        alterations = ", ".join(
+            f"ALTER COLUMN {column} TYPE {target_type} USING {column}::{target_type}"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alterations};")
+
+
+def _create_search_trigger() -> None:
+    op.execute(
+        """
+        CREATE TRIGGER items_search_document_trigger
+            BEFORE INSERT OR UPDATE OF type, payload, tags ON items
+            FOR EACH ROW EXECUTE FUNCTION items_update_search_document();
+    """
+    )
+
+
+def upgrade() -> None:
+    """Store entity JSON as jsonb so reads skip reparsing the text."""
+    # items.payload is in the search trigger's UPDATE OF column list, which
+    # blocks changing its type while the trigger exists
+    op.execute("DROP TRIGGER IF EXISTS items_search_document_trigger ON items;")
+    _alter_json_columns("jsonb")
+    _create_search_trigger()
+
+
+def downgrade() -> None:
+    """Convert the columns back to json."""
+    op.execute("DROP TRIGGER IF EXISTS items_search_document_trigger ON items;")
+    _alter_json_columns("json")
+    _create_search_trigger()
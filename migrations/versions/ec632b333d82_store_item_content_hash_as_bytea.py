@@ -0,0 +1,46 @@
+"""store item content_hash as raw bytea digest
+
+Revision ID: ec632b333d82
+Revises: b94f82918f95
+Create Date: 2026-10-17 14:05:27.861930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ec632b333d82"
+down_revision: Union[str, Sequence[str], None] = "b94f82918f95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert hex SHA-256 strings to 32-byte digests."""
+    # Values that are not a hex SHA-256 (e.g. old seed placeholders) can never
+    # match a computed hash, so they become NULL. items_content_hash_idx is
+    # rebuilt by the type change.
+    op.execute(
+        """
+        ALTER TABLE items
+            ALTER COLUMN content_hash TYPE bytea
+            USING CASE
+                WHEN content_hash ~ '^[0-9a-fA-F]{64}$' THEN decode(content_hash, 'hex')
+            END;
+    """
+    )
+
+
+def downgrade() -> None:
+    """Convert digests back to hex strings."""
+    op.execute(
+        """
+        ALTER TABLE items
+            ALTER COLUMN content_hash TYPE varchar(64)
+            USING encode(content_hash, 'hex');
+    """
+    )
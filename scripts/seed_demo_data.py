@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from api.config.settings import settings
 from api.v1.items.models import Item, Organization, User
+from api.v1.items.utils import content_hash
 from api.v1.review.models import SchedulerState
 
 
@@ -297,7 +298,7 @@ async def seed_demo_data():
                     tags=item_data["tags"],
                     difficulty=item_data["difficulty"],
                     payload=item_data["payload"],
-                    content_hash=f"demo_hash_{len(created_items)}",
+                    content_hash=content_hash(item_data["type"], item_data["payload"]),
                     status="published",
                     created_by="seed_script",
                 )
@@ -13,6 +13,8 @@ from api.main import create_app
 
 # Import models to ensure they're registered
 from api.v1.items import models  # noqa: F401
+from api.v1.items.cache import clear_item_cache
+from api.v1.items.routes import forget_dev_entities
 from api.v1.quiz import models as quiz_models  # noqa: F401
 from api.v1.review import models as review_models  # noqa: F401
 
@@ -154,6 +156,8 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.execute(text("DELETE FROM sources"))
         await session.execute(text("DELETE FROM media_assets"))
         await session.commit()
+        forget_dev_entities()
+        clear_item_cache()
 
 
 @pytest.fixture
@@ -178,6 +178,24 @@ Q: What is the capital of France?
         assert diagnostics[0]["severity"] == "error"
         assert "missing required Q: and/or A: fields" in diagnostics[0]["issue"]
 
+    def test_parse_short_answer_invalid_pattern(self):
+        """Test that an invalid PATTERN regex is reported at import time."""
+        importer = MarkdownImporter()
+        content = """
+:::short
+PROMPT: What is 2+2?
+EXPECTED: 4
+PATTERN: ^[0-9+$
+:::
+"""
+        diagnostics = []
+        items = importer.parse(content, diagnostics=diagnostics)
+
+        assert len(items) == 0
+        assert len(diagnostics) == 1
+        assert diagnostics[0]["severity"] == "error"
+        assert "Invalid PATTERN '^[0-9+$'" in diagnostics[0]["issue"]
+
 
 class TestCSVImporter:
     """Test the CSV importer."""
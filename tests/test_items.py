@@ -1,7 +1,11 @@
+import json
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
 
+from api.v1.items import routes
+from api.v1.items.utils import content_hash
+
 
 class TestItems:
     """Test suite for item CRUD operations."""
@@ -187,6 +191,32 @@ class TestItems:
         assert len(data["items"]) == 1
         assert data["items"][0]["difficulty"] == "core"
 
+    def test_list_items_cursor_pagination(self, client: TestClient):
+        """Test paging through items with next_cursor."""
+        for i in range(5):
+            client.post(
+                "/v1/items",
+                json={"type": "flashcard", "payload": {"front": f"Q{i}", "back": "A"}},
+            )
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = client.get("/v1/items", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 5
+            seen.extend(item["id"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            params = {"limit": 2, "cursor": data["next_cursor"]}
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+        response = client.get("/v1/items", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
     def test_get_item_by_id(self, client: TestClient):
         """Test retrieving a specific item by ID."""
         # Create an item first
@@ -343,3 +373,67 @@ class TestItems:
 
         # But different IDs
         assert data1["id"] != data2["id"]
+
+    def test_large_import_is_copied_and_reads_back(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test that rows written by the COPY import path read back intact."""
+        copied_batches = []
+        copy_items = routes._copy_items
+
+        async def recording_copy_items(session, rows):
+            copied_batches.append(len(rows))
+            await copy_items(session, rows)
+
+        monkeypatch.setattr(routes, "_copy_items", recording_copy_items)
+
+        count = routes.IMPORT_COPY_THRESHOLD + 20
+        items = [
+            {
+                "type": "flashcard",
+                "payload": {"front": f"Copy question {i}", "back": f"zebra{i}"},
+                "tags": ["bulk", "copy"],
+                "difficulty": "intro",
+                "metadata": {"batch": "copy-test"},
+            }
+            for i in range(count)
+        ]
+        response = client.post(
+            "/v1/items/import",
+            json={
+                "format": "json",
+                "data": json.dumps(items),
+                "metadata": {"origin": "test"},
+            },
+        )
+        assert response.status_code == 200
+        staged_ids = response.json()["staged_ids"]
+        assert len(staged_ids) == count
+        assert sum(copied_batches) == count
+
+        response = client.get("/v1/items/staged", params={"limit": 1000})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == count
+        by_id = {item["id"]: item for item in data["items"]}
+        assert set(staged_ids) == set(by_id)
+
+        item = by_id[staged_ids[7]]
+        assert item["type"] == "flashcard"
+        assert item["payload"]["front"] == "Copy question 7"
+        assert item["payload"]["back"] == "zebra7"
+        assert item["tags"] == ["bulk", "copy"]
+        assert item["difficulty"] == "intro"
+        assert item["status"] == "draft"
+        assert item["content_hash"] == content_hash("flashcard", item["payload"]).hex()
+        assert item["meta"] == {
+            "origin": "test",
+            "batch": "copy-test",
+            "source_format": "json",
+            "source_item": 7,
+        }
+
+        # Full-text search reads search_document, which the insert trigger fills
+        response = client.get("/v1/items", params={"q": "zebra7"})
+        assert response.status_code == 200
+        assert [found["id"] for found in response.json()["items"]] == [staged_ids[7]]
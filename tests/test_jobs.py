@@ -0,0 +1,253 @@
+"""Tests for job service helpers."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select
+
+from api.config.settings import Settings
+from api.v1.core.cache import TTLCache
+from api.v1.infra.jobs.models import Job, JobStatus
+from api.v1.infra.jobs.schemas import JobResponse
+from api.v1.infra.jobs.service import JobService, generate_dedupe_key, job_cache
+from api.v1.infra.jobs.worker import JobOutcome, JobWorker
+
+
+class TestGenerateDedupeKey:
+    """Test deterministic job deduplication keys."""
+
+    def test_key_is_deterministic(self):
+        """Same type and params always produce the same key."""
+        key = generate_dedupe_key("compute_item_embedding", item_id="abc")
+        assert key == generate_dedupe_key("compute_item_embedding", item_id="abc")
+        assert len(key) == 32
+
+    def test_param_order_does_not_matter(self):
+        """Keyword order is canonicalized before hashing."""
+        assert generate_dedupe_key("job", a=1, b="x") == generate_dedupe_key(
+            "job", b="x", a=1
+        )
+
+    def test_different_inputs_produce_different_keys(self):
+        """Type and parameter values are both part of the key."""
+        base = generate_dedupe_key("job", org_id="org-1", force_recompute=False)
+        assert base != generate_dedupe_key("job", org_id="org-1", force_recompute=True)
+        assert base != generate_dedupe_key(
+            "other_job", org_id="org-1", force_recompute=False
+        )
+
+    def test_equal_scalars_of_different_types_are_distinct(self):
+        """1, True and 1.0 compare equal but must not share a cached key."""
+        keys = {
+            generate_dedupe_key("j", a=1),
+            generate_dedupe_key("j", a=True),
+            generate_dedupe_key("j", a=1.0),
+        }
+        assert len(keys) == 3
+        assert generate_dedupe_key("j", a=1) != generate_dedupe_key("j", a=True)
+
+    def test_containers_differ_from_their_json_strings(self):
+        """A list or dict param does not collide with a string of its JSON."""
+        assert generate_dedupe_key("t", a=[1]) != generate_dedupe_key("t", a="[1]")
+        assert generate_dedupe_key("t", a={"x": 1}) != generate_dedupe_key(
+            "t", a='{"x": 1}'
+        )
+
+    def test_unhashable_params_are_supported(self):
+        """Dict and list params are canonicalized so they can be cached."""
+        key = generate_dedupe_key("job", tags=["a", "b"], options={"y": 2, "x": 1})
+        assert key == generate_dedupe_key(
+            "job", options={"x": 1, "y": 2}, tags=["a", "b"]
+        )
+        assert key != generate_dedupe_key(
+            "job", tags=["b", "a"], options={"y": 2, "x": 1}
+        )
+
+
+class TestTTLCache:
+    """Test the in-process cache used for hot job reads."""
+
+    def test_entries_expire(self, monkeypatch):
+        """Values are returned until their TTL elapses."""
+        clock = [100.0]
+        monkeypatch.setattr("api.v1.core.cache.time.monotonic", lambda: clock[0])
+        cache: TTLCache[str] = TTLCache(ttl_seconds=1.0)
+
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        clock[0] += 1.0
+        assert cache.get("key") is None
+
+    def test_invalidate_and_disabled_ttl(self):
+        """Invalidation drops entries and a zero TTL disables caching."""
+        cache: TTLCache[int] = TTLCache(ttl_seconds=60)
+        cache.set("key", 1)
+        cache.invalidate("key")
+        assert cache.get("key") is None
+
+        disabled: TTLCache[int] = TTLCache(ttl_seconds=0)
+        disabled.set("key", 1)
+        assert disabled.get("key") is None
+
+    def test_maxsize_evicts_oldest(self):
+        """The oldest entry is dropped once the cache is full."""
+        cache: TTLCache[int] = TTLCache(ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    async def test_job_cache_holds_response_snapshots(self, monkeypatch):
+        """Polled job reads are cached as JobResponse, never as ORM jobs."""
+        now = datetime.now(UTC)
+        job = Job(
+            id=uuid4(),
+            type="compute_item_embedding",
+            org_id=uuid4(),
+            payload={},
+            status=JobStatus.RUNNING.value,
+            priority=3,
+            run_at=now,
+            attempts=1,
+            progress={"processed": 1, "total": 4},
+            created_at=now,
+            updated_at=now,
+        )
+        loads = []
+
+        async def get_job_by_id(session, job_id, org_id=None):
+            loads.append(job_id)
+            return job
+
+        service = JobService(Settings())
+        monkeypatch.setattr(service, "get_job_by_id", get_job_by_id)
+        try:
+            first = await service.get_job_response(None, job.id, job.org_id)
+            second = await service.get_job_response(None, job.id, job.org_id)
+            assert loads == [job.id]
+            assert isinstance(job_cache.get(job.id), JobResponse)
+            assert second is first
+            assert first.progress_percentage == 25.0
+        finally:
+            job_cache.invalidate(job.id)
+
+
+class _NullSession:
+    """Stands in for a database session; flushes are recorded instead."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _recording_worker(monkeypatch, fail_on=None):
+    """A worker whose completion flushes are captured in the returned list."""
+    worker = JobWorker(Settings(job_completion_flush_ms=10))
+    worker._session_factory = _NullSession
+    flushed = []
+
+    async def flush(session, outcomes):
+        if fail_on is not None and any(o.job_id == fail_on for o in outcomes):
+            raise ValueError("cannot store result")
+        flushed.extend(outcomes)
+
+    monkeypatch.setattr(worker, "_flush_completions", flush)
+    return worker, flushed
+
+
+class TestCompletionFlushing:
+    """Test that buffered job completions reach the database."""
+
+    async def test_stop_persists_job_finishing_during_shutdown(self, monkeypatch):
+        """A job still running when stop() is called has its outcome written."""
+        worker, flushed = _recording_worker(monkeypatch)
+        worker.running = True
+        flusher = asyncio.create_task(worker._flush_completions_loop())
+        job_id = uuid4()
+
+        async def in_flight_job():
+            await asyncio.sleep(0.1)  # Outlasts several flush intervals
+            await worker._mark_job_completed(job_id, JobStatus.SUCCEEDED)
+
+        task = asyncio.create_task(in_flight_job())
+        worker._tasks.add(task)
+        task.add_done_callback(worker._task_done)
+
+        await worker.stop()
+        await asyncio.wait_for(flusher, timeout=1)
+
+        assert [(o.job_id, o.status) for o in flushed] == [
+            (job_id, JobStatus.SUCCEEDED)
+        ]
+
+    async def test_failed_batch_only_drops_bad_outcome(self, monkeypatch):
+        """One unwritable outcome does not lose the rest of its batch."""
+        bad_id, good_ids = uuid4(), [uuid4(), uuid4()]
+        worker, flushed = _recording_worker(monkeypatch, fail_on=bad_id)
+        worker.running = True
+        flusher = asyncio.create_task(worker._flush_completions_loop())
+
+        for job_id in [good_ids[0], bad_id, good_ids[1]]:
+            await worker._completion_buffer.put(
+                JobOutcome(job_id=job_id, status=JobStatus.SUCCEEDED)
+            )
+
+        await worker.stop()
+        await asyncio.wait_for(flusher, timeout=1)
+
+        assert [o.job_id for o in flushed] == good_ids
+
+
+class TestPerOrgClaimCap:
+    """Test that job_per_org_max_concurrent limits what one claim takes."""
+
+    async def test_busy_org_cannot_take_every_slot(self, db_session):
+        """A second org's job is claimed while a busy org stays at its cap."""
+        cap = 2
+        worker = JobWorker(Settings(job_concurrency=6, job_per_org_max_concurrent=cap))
+        busy_org, quiet_org = uuid4(), uuid4()
+        run_at = datetime.now(UTC) - timedelta(minutes=1)
+
+        def job(org_id, status=JobStatus.QUEUED):
+            return Job(
+                type="compute_item_embedding",
+                org_id=org_id,
+                payload={},
+                status=status.value,
+                run_at=run_at,
+            )
+
+        # The busy org already has one job running and plenty queued
+        db_session.add_all(
+            [job(busy_org, JobStatus.RUNNING)]
+            + [job(busy_org) for _ in range(5)]
+            + [job(quiet_org)]
+        )
+        await db_session.commit()
+
+        try:
+            claimed = await worker._claim_jobs(db_session)
+
+            claimed_orgs = [claimed_job.org_id for claimed_job in claimed]
+            assert claimed_orgs.count(quiet_org) == 1
+            assert claimed_orgs.count(busy_org) == cap - 1
+
+            running = await db_session.scalar(
+                select(func.count())
+                .select_from(Job)
+                .where(
+                    Job.org_id == busy_org,
+                    Job.status == JobStatus.RUNNING.value,
+                )
+            )
+            assert running == cap
+        finally:
+            await db_session.execute(
+                delete(Job).where(Job.org_id.in_([busy_org, quiet_org]))
+            )
+            await db_session.commit()
@@ -55,7 +55,7 @@ class TestStep8Integration:
         # Check configuration
         assert search_service.keyword_weight == 0.3
         assert search_service.vector_weight == 0.7
-        assert search_service.use_tsvector == (
+        assert search_service.use_vectors == (
             settings.environment in ("production", "staging")
         )
 